@@ -25,13 +25,30 @@ class Settings:
         HOST: Bind address for the ASGI server.
         PORT: Bind port for the ASGI server.
         DEBUG: Enable debug mode (verbose logging, auto-reload).
+        WARMUP_MODELS: Load all pipeline models at startup instead of on
+            the first job that needs them.
         STORAGE_DIR: Root directory for persistent file storage.
         HF_TOKEN: Hugging Face API token (required for gated models).
         DEMUCS_MODEL: Demucs model variant for source separation.
         WHISPER_MODEL: Faster-Whisper model size for transcription.
         WHISPER_DEVICE: Compute device for Whisper (``auto`` resolves at runtime).
         WHISPER_COMPUTE_TYPE: Numerical precision for Whisper inference.
+        WHISPER_CONCURRENCY: Number of speakers transcribed concurrently
+            during upload analysis; also the number of Whisper workers.
         QWEN_TTS_MODEL: Hugging Face model ID for Qwen3 TTS.
+        INFERENCE_DTYPE: Precision for the Qwen3 and MMS TTS models on CUDA
+            (``fp32``, ``fp16`` or ``bf16``); CPU inference always uses
+            float32.
+        TORCH_FAST_KERNELS: Enable cuDNN autotuning and TF32 matmuls for
+            every torch model in the process (Demucs, pyannote and TTS).
+        TTS_CONCURRENCY: Maximum number of TTS model calls run concurrently.
+        TTS_BATCH_SIZE: Maximum number of same-speaker segments synthesised
+            in one TTS model call.
+        ALIGN_QUEUE_DEPTH: Maximum number of synthesised segments waiting
+            to be time-aligned during voice replacement.
+        DEBUG_SEGMENTS: Also write per-segment synthesised and aligned WAVs
+            to the job's ``segments/`` folder (voice replacement otherwise
+            keeps them in memory).
         PYANNOTE_MODEL: Hugging Face model ID for speaker diarization.
         MIN_SPEAKERS: Minimum number of speakers for diarization.
         MAX_SPEAKERS: Maximum number of speakers for diarization.
@@ -62,6 +79,8 @@ class Settings:
         self.PORT: int = int(os.getenv("PORT", "8000"))
         self.DEBUG: bool = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes")
 
+        self.WARMUP_MODELS: bool = os.getenv("WARMUP_MODELS", "false").lower() in ("true", "1", "yes")
+
         # --- Storage ---
         self.STORAGE_DIR: Path = Path(os.getenv("STORAGE_DIR", "storage"))
 
@@ -75,11 +94,18 @@ class Settings:
         self.WHISPER_MODEL: str = os.getenv("WHISPER_MODEL", "large-v3")
         self.WHISPER_DEVICE: str = os.getenv("WHISPER_DEVICE", "auto")
         self.WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "float16")
+        self.WHISPER_CONCURRENCY: int = int(os.getenv("WHISPER_CONCURRENCY", "2"))
 
         # --- TTS ---
         self.QWEN_TTS_MODEL: str = os.getenv("QWEN_TTS_MODEL", "Qwen/Qwen3-TTS-12Hz-1.7B-Base")
         self.MMS_TTS_MODEL: str = os.getenv("MMS_TTS_MODEL", "facebook/mms-tts-ben")
         self.INDICF5_MODEL: str = os.getenv("INDICF5_MODEL", "ai4bharat/IndicF5")
+        self.INFERENCE_DTYPE: str = os.getenv("INFERENCE_DTYPE", "bf16").lower()
+        self.TORCH_FAST_KERNELS: bool = os.getenv("TORCH_FAST_KERNELS", "true").lower() in ("true", "1", "yes")
+        self.TTS_CONCURRENCY: int = int(os.getenv("TTS_CONCURRENCY", "2"))
+        self.TTS_BATCH_SIZE: int = int(os.getenv("TTS_BATCH_SIZE", "8"))
+        self.ALIGN_QUEUE_DEPTH: int = int(os.getenv("ALIGN_QUEUE_DEPTH", "32"))
+        self.DEBUG_SEGMENTS: bool = os.getenv("DEBUG_SEGMENTS", "false").lower() in ("true", "1", "yes")
 
         # --- Diarization ---
         self.PYANNOTE_MODEL: str = os.getenv(
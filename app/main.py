@@ -77,6 +77,8 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         settings.APP_VERSION,
         settings.STORAGE_DIR,
     )
+    if settings.WARMUP_MODELS:
+        await orchestrator.warmup()
     yield
     logger.info("%s shutting down", settings.APP_NAME)
 
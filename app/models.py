@@ -108,6 +108,10 @@ class JobInfo(BaseModel):
         created_at: UTC timestamp when the job was created.
         updated_at: UTC timestamp of the last status change.
         output_file: Path to the final output file, else ``None``.
+        original_input_path: Path to the original upload on disk, else
+            ``None``.
+        vocals_path: Path to the separated vocals track, else ``None``.
+        music_path: Path to the separated accompaniment track, else ``None``.
     """
 
     job_id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
@@ -121,6 +125,9 @@ class JobInfo(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     output_file: Optional[str] = None
+    original_input_path: Optional[str] = None
+    vocals_path: Optional[str] = None
+    music_path: Optional[str] = None
 
 
 # ---------------------------------------------------------------------------
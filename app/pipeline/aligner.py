@@ -6,6 +6,8 @@ This ensures lip-sync accuracy and seamless integration with the background
 music track during the merge stage.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 from pathlib import Path
@@ -14,6 +16,7 @@ import numpy as np
 import soundfile as sf
 
 from app.config import settings
+from app.utils.buffer_pool import PCMBufferPool
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,10 @@ class AudioAligner:
 
     All public methods are ``async`` and delegate blocking audio I/O and DSP
     operations to a thread pool so the event loop is never blocked.
+
+    Args:
+        buffer_pool: Shared PCM buffer pool used for WAV writes.  A private
+                     pool is created when ``None``.
     """
 
     # Stretch ratio bounds -- beyond these the audio quality degrades
@@ -38,6 +45,9 @@ class AudioAligner:
     # padding or trimming.
     _FADE_DURATION: float = 0.01
 
+    def __init__(self, buffer_pool: PCMBufferPool | None = None) -> None:
+        self._buffer_pool = buffer_pool or PCMBufferPool()
+
     # ------------------------------------------------------------------
     # Public: single-segment alignment
     # ------------------------------------------------------------------
@@ -76,6 +86,35 @@ class AudioAligner:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         audio, sr = await asyncio.to_thread(sf.read, str(audio_path), "float32")
+        audio = await self.align_audio(audio, sr, target_duration, audio_path.name)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(self._buffer_pool.write_wav, output_path, audio, sr)
+        logger.info("Aligned segment saved: %s (%.3fs)", output_path.name, target_duration)
+        return output_path
+
+    async def align_audio(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        target_duration: float,
+        label: str = "segment",
+    ) -> np.ndarray:
+        """Time-align an in-memory audio array to *target_duration* seconds.
+
+        Applies the same stretch / pad / trim rules as :meth:`align_segment`
+        without touching the disk.
+
+        Args:
+            audio: Audio array (multi-channel input is downmixed to mono).
+            sr: Sample rate of *audio*.
+            target_duration: Desired duration in seconds.
+            label: Name used in log messages.
+
+        Returns:
+            A 1-D float32 array of exactly ``int(target_duration * sr)``
+            samples.
+        """
         if audio.ndim > 1:
             audio = audio.mean(axis=1)
 
@@ -96,7 +135,7 @@ class AudioAligner:
                 audio = self.pad_or_trim(audio, target_samples, sr)
                 logger.debug(
                     "Stretched %s: %.3fs -> %.3fs (ratio=%.3f)",
-                    audio_path.name,
+                    label,
                     actual_duration,
                     target_duration,
                     stretch_ratio,
@@ -110,15 +149,12 @@ class AudioAligner:
                     stretch_ratio,
                     self._MIN_STRETCH,
                     self._MAX_STRETCH,
-                    audio_path.name,
+                    label,
                     actual_duration,
                     target_duration,
                 )
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        sf.write(str(output_path), audio, sr)
-        logger.info("Aligned segment saved: %s (%.3fs)", output_path.name, target_duration)
-        return output_path
+        return audio
 
     # ------------------------------------------------------------------
     # Public: batch alignment
@@ -140,6 +176,9 @@ class AudioAligner:
 
         After alignment, each dictionary is updated in-place with an
         ``aligned_path`` key pointing to the aligned WAV file in *output_dir*.
+        Dictionaries that carry in-memory ``audio`` (and ``sr``) instead of
+        ``audio_path`` are aligned without touching the disk; see
+        :meth:`align_segment_entry`.
 
         Args:
             segments: List of segment dictionaries.
@@ -151,36 +190,81 @@ class AudioAligner:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         for idx, seg in enumerate(segments):
-            audio_path = Path(seg["audio_path"])
-            target_start: float = seg["target_start"]
-            target_end: float = seg["target_end"]
-            speaker_id: str = seg.get("speaker_id", "unknown")
-            target_duration = target_end - target_start
+            await self.align_segment_entry(seg, idx, output_dir)
 
-            if target_duration <= 0:
-                logger.warning(
-                    "Segment %d (%s) has non-positive duration (%.3f); skipping",
-                    idx, speaker_id, target_duration,
-                )
-                seg["aligned_path"] = audio_path
-                continue
+        logger.info("Aligned %d segments into %s", len(segments), output_dir)
+        return segments
+
+    async def align_segment_entry(
+        self,
+        seg: dict,
+        idx: int,
+        output_dir: Path,
+    ) -> dict:
+        """Align one segment dictionary as :meth:`align_all_segments` does.
 
-            aligned_name = f"aligned_{speaker_id}_{idx:04d}.wav"
-            aligned_path = output_dir / aligned_name
+        This lets callers align segments as they become available instead
+        of collecting the whole batch first.  *seg* uses the keys described
+        in :meth:`align_all_segments` and is updated in-place with an
+        ``aligned_path`` key.  On failure (or for a non-positive target
+        duration) the unaligned ``audio_path`` is used so that the
+        pipeline can continue.
 
+        If *seg* holds an in-memory ``audio`` array (with its ``sr``), that
+        array is aligned and replaced in-place instead, and no file is read
+        or written; on failure the unaligned array is kept.
+
+        Args:
+            seg: Segment dictionary to align.
+            idx: Segment index, used for the aligned filename.
+            output_dir: Directory where the aligned file is written.
+
+        Returns:
+            *seg* with ``aligned_path`` set.
+        """
+        target_start: float = seg["target_start"]
+        target_end: float = seg["target_end"]
+        speaker_id: str = seg.get("speaker_id", "unknown")
+        target_duration = target_end - target_start
+
+        if target_duration <= 0:
+            logger.warning(
+                "Segment %d (%s) has non-positive duration (%.3f); skipping",
+                idx, speaker_id, target_duration,
+            )
+            if seg.get("audio") is None:
+                seg["aligned_path"] = Path(seg["audio_path"])
+            return seg
+
+        if seg.get("audio") is not None:
             try:
-                await self.align_segment(audio_path, target_duration, aligned_path)
-                seg["aligned_path"] = aligned_path
+                seg["audio"] = await self.align_audio(
+                    seg["audio"], seg["sr"], target_duration,
+                    f"segment {idx} ({speaker_id})",
+                )
             except Exception as exc:
                 logger.error(
                     "Failed to align segment %d (%s): %s",
                     idx, speaker_id, exc,
                 )
-                # Fall back to unaligned audio so the pipeline can continue
-                seg["aligned_path"] = audio_path
-
-        logger.info("Aligned %d segments into %s", len(segments), output_dir)
-        return segments
+            return seg
+
+        audio_path = Path(seg["audio_path"])
+
+        aligned_name = f"aligned_{speaker_id}_{idx:04d}.wav"
+        aligned_path = output_dir / aligned_name
+
+        try:
+            await self.align_segment(audio_path, target_duration, aligned_path)
+            seg["aligned_path"] = aligned_path
+        except Exception as exc:
+            logger.error(
+                "Failed to align segment %d (%s): %s",
+                idx, speaker_id, exc,
+            )
+            # Fall back to unaligned audio so the pipeline can continue
+            seg["aligned_path"] = audio_path
+        return seg
 
     # ------------------------------------------------------------------
     # Public: pad / trim
@@ -36,6 +36,10 @@ class SpeakerDiarizer:
     # Lazy pipeline loading
     # ------------------------------------------------------------------
 
+    async def warmup(self) -> None:
+        """Load the diarization pipeline ahead of the first job."""
+        await asyncio.to_thread(self._ensure_pipeline)
+
     def _ensure_pipeline(self) -> None:
         """Load the pyannote diarization pipeline if not already initialised.
 
@@ -126,11 +130,16 @@ class SpeakerDiarizer:
 
         def _run_diarization() -> list[SpeakerSegment]:
             """Blocking diarization executed in a worker thread."""
-            diarization = self._pipeline(
-                str(audio_path),
-                min_speakers=min_s,
-                max_speakers=max_s,
-            )
+            import torch  # type: ignore[import-untyped]
+
+            # Kept in fp32: pyannote hands its embeddings to numpy and
+            # scipy clustering, neither of which accepts half precision.
+            with torch.inference_mode():
+                diarization = self._pipeline(
+                    str(audio_path),
+                    min_speakers=min_s,
+                    max_speakers=max_s,
+                )
 
             segments: list[SpeakerSegment] = []
             for turn, _, speaker in diarization.itertracks(yield_label=True):
@@ -5,6 +5,8 @@ track, applies intelligent ducking so speech remains intelligible, and
 optionally muxes the final audio back into the original video container.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import subprocess
@@ -14,6 +16,7 @@ import numpy as np
 import soundfile as sf
 
 from app.config import settings
+from app.utils.audio_utils import resample
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,7 @@ class AudioMerger:
     _SPEECH_THRESHOLD_DB: float = -40.0  # amplitude below this is "silence"
     _CROSSFADE_DURATION: float = 0.015  # seconds, boundary crossfade length
     _NORMALIZATION_HEADROOM_DB: float = -1.0  # peak target after mixing
+    _WRITE_BLOCK_FRAMES: int = 1 << 20  # frames per block when writing the mix
 
     # ------------------------------------------------------------------
     # Public: multi-segment merge with ducking
@@ -58,7 +62,9 @@ class AudioMerger:
 
         Each segment dict must contain:
 
-        * ``aligned_path`` (``Path``) -- WAV of the aligned speech.
+        * ``aligned_path`` (``Path``) -- WAV of the aligned speech, or
+          ``audio`` (``np.ndarray``) and ``sr`` (``int``) -- the aligned
+          speech in memory, which takes precedence.
         * ``target_start`` (``float``) -- start time in seconds.
         * ``target_end`` (``float``) -- end time in seconds.
 
@@ -83,7 +89,7 @@ class AudioMerger:
         )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        sf.write(str(output_path), result, sr)
+        await asyncio.to_thread(self._write_wav_blocks, output_path, result, sr)
         logger.info(
             "Merged %d speech segments with music: %s (%.2fs)",
             len(speech_segments),
@@ -109,21 +115,23 @@ class AudioMerger:
         # 3. Stamp each speech segment onto the canvas
         fade_samples = max(1, int(self._CROSSFADE_DURATION * sr))
         for seg in speech_segments:
-            aligned_path = Path(seg["aligned_path"])
             target_start: float = seg["target_start"]
 
-            if not aligned_path.exists():
-                logger.warning("Aligned file missing, skipping: %s", aligned_path)
-                continue
+            if seg.get("audio") is not None:
+                seg_audio, seg_sr = seg["audio"], seg.get("sr", sr)
+            else:
+                aligned_path = Path(seg["aligned_path"])
+                if not aligned_path.exists():
+                    logger.warning("Aligned file missing, skipping: %s", aligned_path)
+                    continue
+                seg_audio, seg_sr = sf.read(str(aligned_path), dtype="float32")
 
-            seg_audio, seg_sr = sf.read(str(aligned_path), dtype="float32")
             if seg_audio.ndim > 1:
                 seg_audio = seg_audio.mean(axis=1)
 
             # Resample if needed
             if seg_sr != sr:
-                import librosa  # noqa: WPS433
-                seg_audio = librosa.resample(seg_audio, orig_sr=seg_sr, target_sr=sr)
+                seg_audio = resample(seg_audio, seg_sr, sr)
 
             start_sample = int(target_start * sr)
             end_sample = start_sample + len(seg_audio)
@@ -198,8 +206,7 @@ class AudioMerger:
         if speech.ndim > 1:
             speech = speech.mean(axis=1)
         if sp_sr != sr:
-            import librosa  # noqa: WPS433
-            speech = librosa.resample(speech, orig_sr=sp_sr, target_sr=sr)
+            speech = resample(speech, sp_sr, sr)
 
         total_samples = len(speech)
         music = self._load_and_fit(music_path, total_samples, sr)
@@ -340,10 +347,151 @@ class AudioMerger:
 
         return results
 
+    # ------------------------------------------------------------------
+    # Public: single-pass finalisation
+    # ------------------------------------------------------------------
+
+    async def finalize(
+        self,
+        wav_path: Path,
+        output_dir: Path,
+        original_video: Path | None = None,
+    ) -> dict[str, Path]:
+        """Export *wav_path* and optionally rebuild video in one FFmpeg run.
+
+        Equivalent to :meth:`export_formats` followed by
+        :meth:`rebuild_video`, but both outputs are produced by a single
+        FFmpeg process so the WAV is decoded once and only one process is
+        spawned.  The MP3 uses the same settings as :meth:`export_formats`;
+        the video is written next to it as ``{stem}.mp4`` with the video
+        stream copied.
+
+        If the combined run fails (or FFmpeg cannot be started) while a
+        video is requested, the outputs are retried separately with
+        :meth:`rebuild_video` and :meth:`export_formats`, so only a failed
+        video rebuild is fatal and a failed MP3 export is just logged.
+
+        Args:
+            wav_path: Source WAV file.
+            output_dir: Directory for the exported files.
+            original_video: Optional source video whose audio track is
+                replaced with *wav_path*.
+
+        Returns:
+            Mapping of output kind to path, e.g.
+            ``{"wav": Path(...), "mp3": Path(...), "video": Path(...)}``.
+
+        Raises:
+            FileNotFoundError: If *wav_path* or *original_video* is missing,
+                or FFmpeg cannot be found while a video is requested.
+            RuntimeError: If FFmpeg fails while rebuilding the video.
+        """
+        if not wav_path.exists():
+            raise FileNotFoundError(f"WAV file not found: {wav_path}")
+        if original_video is not None and not original_video.exists():
+            raise FileNotFoundError(f"Original video not found: {original_video}")
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = wav_path.stem
+        results: dict[str, Path] = {"wav": wav_path}
+        mp3_path = output_dir / f"{stem}.mp3"
+        video_path = output_dir / f"{stem}.mp4"
+
+        cmd = [settings.FFMPEG_PATH, "-y", "-i", str(wav_path)]
+        if original_video is not None:
+            cmd += ["-i", str(original_video)]
+        cmd += [
+            "-map", "0:a:0",
+            "-codec:a", "libmp3lame",
+            "-qscale:a", "2",
+            str(mp3_path),
+        ]
+        if original_video is not None:
+            cmd += [
+                "-map", "1:v:0",
+                "-map", "0:a:0",
+                "-c:v", "copy",
+                "-shortest",
+                str(video_path),
+            ]
+
+        logger.info(
+            "Finalising %s -> %s%s",
+            wav_path.name,
+            mp3_path.name,
+            f", {video_path.name}" if original_video is not None else "",
+        )
+
+        try:
+            result = await asyncio.to_thread(
+                subprocess.run, cmd, capture_output=True,
+            )
+        except FileNotFoundError:
+            if original_video is not None:
+                return await self._finalize_separately(
+                    wav_path, output_dir, original_video, video_path,
+                )
+            logger.warning(
+                "FFmpeg not found at '%s' — skipping MP3 export. "
+                "Install FFmpeg or set FFMPEG_PATH in .env",
+                settings.FFMPEG_PATH,
+            )
+            return results
+
+        if result.returncode != 0:
+            stderr_text = result.stderr.decode(errors="replace").strip()
+            if original_video is not None:
+                logger.warning(
+                    "Combined FFmpeg finalisation failed (rc=%d), retrying "
+                    "video and MP3 separately: %s",
+                    result.returncode,
+                    stderr_text,
+                )
+                return await self._finalize_separately(
+                    wav_path, output_dir, original_video, video_path,
+                )
+            logger.warning("MP3 export failed (rc=%d): %s", result.returncode, stderr_text)
+            return results
+
+        results["mp3"] = mp3_path
+        if original_video is not None:
+            results["video"] = video_path
+        logger.info("Finalisation complete: %s", ", ".join(p.name for p in results.values()))
+        return results
+
+    async def _finalize_separately(
+        self,
+        wav_path: Path,
+        output_dir: Path,
+        original_video: Path,
+        video_path: Path,
+    ) -> dict[str, Path]:
+        """Fallback for :meth:`finalize`: one FFmpeg run per output.
+
+        The video rebuild raises on failure; the MP3 export only logs.
+        """
+        await self.rebuild_video(original_video, wav_path, video_path)
+        results = await self.export_formats(wav_path, output_dir)
+        results["video"] = video_path
+        return results
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _write_wav_blocks(cls, output_path: Path, audio: np.ndarray, sr: int) -> None:
+        """Write a long mono mix to *output_path* as 16-bit PCM WAV in blocks.
+
+        The file is opened once and filled block by block, so the int16
+        conversion never materialises a second full-length copy of the mix.
+        """
+        with sf.SoundFile(
+            str(output_path), "w", samplerate=sr, channels=1, subtype="PCM_16",
+        ) as out:
+            for start in range(0, len(audio), cls._WRITE_BLOCK_FRAMES):
+                out.write(audio[start:start + cls._WRITE_BLOCK_FRAMES])
+
     @staticmethod
     def _load_and_fit(
         audio_path: Path,
@@ -369,8 +517,7 @@ class AudioMerger:
             audio = audio.mean(axis=1)
 
         if file_sr != sr:
-            import librosa  # noqa: WPS433
-            audio = librosa.resample(audio, orig_sr=file_sr, target_sr=sr)
+            audio = resample(audio, file_sr, sr)
 
         current = len(audio)
         if current >= target_samples:
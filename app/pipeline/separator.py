@@ -39,6 +39,10 @@ class AudioSeparator:
     # Lazy model loading
     # ------------------------------------------------------------------
 
+    async def warmup(self) -> None:
+        """Load the Demucs model ahead of the first job."""
+        await asyncio.to_thread(self._ensure_model)
+
     def _ensure_model(self) -> None:
         """Load the Demucs model if not already initialised.
 
@@ -74,15 +78,21 @@ class AudioSeparator:
         self,
         audio_path: Path,
         output_dir: Path,
+        vocals_ready: asyncio.Future[Path] | None = None,
     ) -> tuple[Path, Path]:
         """Separate *audio_path* into vocals and accompaniment stems.
 
         The two output files are written to *output_dir* as
-        ``vocals.wav`` and ``accompaniment.wav``.
+        ``vocals.wav`` and ``accompaniment.wav``.  The vocals stem is
+        finalised first; when *vocals_ready* is given its result is set
+        to the vocals path at that point so that callers can start work
+        on it while the accompaniment is still being written.
 
         Args:
-            audio_path: Path to the input audio file (WAV recommended).
-            output_dir: Directory where output stems will be written.
+            audio_path:   Path to the input audio file (WAV recommended).
+            output_dir:   Directory where output stems will be written.
+            vocals_ready: Optional future resolved with the vocals path as
+                          soon as ``vocals.wav`` is in place.
 
         Returns:
             A ``(vocals_path, accompaniment_path)`` tuple of :class:`Path`
@@ -106,9 +116,9 @@ class AudioSeparator:
         self._ensure_model()
 
         if self._use_cli_fallback:
-            await self._separate_cli(audio_path, output_dir)
+            await self._separate_cli(audio_path, output_dir, vocals_ready)
         else:
-            await self._separate_api(audio_path, output_dir)
+            await self._separate_api(audio_path, output_dir, vocals_ready)
 
         # Validate that both stems were produced
         if not vocals_path.exists():
@@ -135,6 +145,7 @@ class AudioSeparator:
         self,
         audio_path: Path,
         output_dir: Path,
+        vocals_ready: asyncio.Future[Path] | None = None,
     ) -> None:
         """Run separation through the ``demucs.api`` Python interface."""
         logger.info("Separating with Demucs API: %s", audio_path.name)
@@ -149,7 +160,8 @@ class AudioSeparator:
 
             # The API returns (origin, separated) where separated is a
             # dict of {stem_name: tensor}.
-            origin, separated = self._separator.separate_audio_file(audio_path)
+            with torch.inference_mode():
+                origin, separated = self._separator.separate_audio_file(audio_path)
 
             result_paths: dict[str, Path] = {}
             for stem_name, audio_tensor in separated.items():
@@ -176,7 +188,10 @@ class AudioSeparator:
         accompaniment_dest = output_dir / "accompaniment.wav"
 
         self._resolve_stem(result_paths, "vocals", vocals_dest)
-        self._resolve_accompaniment(result_paths, accompaniment_dest)
+        self._notify_vocals_ready(vocals_ready, vocals_dest)
+        await asyncio.to_thread(
+            self._resolve_accompaniment, result_paths, accompaniment_dest,
+        )
 
     # ------------------------------------------------------------------
     # CLI fallback separation
@@ -186,6 +201,7 @@ class AudioSeparator:
         self,
         audio_path: Path,
         output_dir: Path,
+        vocals_ready: asyncio.Future[Path] | None = None,
     ) -> None:
         """Run separation via the ``demucs`` command-line interface."""
         logger.info("Separating with Demucs CLI: %s", audio_path.name)
@@ -231,9 +247,12 @@ class AudioSeparator:
 
         shutil.copy2(str(vocals_src), str(vocals_dest))
         logger.debug("Copied vocals: %s -> %s", vocals_src, vocals_dest)
+        self._notify_vocals_ready(vocals_ready, vocals_dest)
 
         if no_vocals_src.exists():
-            shutil.copy2(str(no_vocals_src), str(accompaniment_dest))
+            await asyncio.to_thread(
+                shutil.copy2, str(no_vocals_src), str(accompaniment_dest),
+            )
             logger.debug(
                 "Copied accompaniment: %s -> %s", no_vocals_src, accompaniment_dest,
             )
@@ -248,6 +267,15 @@ class AudioSeparator:
     # Stem resolution helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _notify_vocals_ready(
+        vocals_ready: asyncio.Future[Path] | None,
+        vocals_path: Path,
+    ) -> None:
+        """Resolve *vocals_ready* with *vocals_path* if it is still pending."""
+        if vocals_ready is not None and not vocals_ready.done():
+            vocals_ready.set_result(vocals_path)
+
     @staticmethod
     def _resolve_stem(
         result_paths: dict[str, Path],
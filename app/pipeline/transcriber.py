@@ -4,6 +4,8 @@ Provides both segment-level transcription (aligned with diarization output)
 and full-file transcription for TTS-only workflows.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import tempfile
@@ -14,6 +16,7 @@ import soundfile as sf
 
 from app.config import settings
 from app.models import SpeakerSegment
+from app.utils.audio_utils import resample
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,10 @@ class SpeechTranscriber:
     # Lazy model loading
     # ------------------------------------------------------------------
 
+    async def warmup(self) -> None:
+        """Load the Whisper model ahead of the first job."""
+        await asyncio.to_thread(self._ensure_model)
+
     def _ensure_model(self) -> None:
         """Load the faster-whisper model if not already initialised.
 
@@ -67,10 +74,13 @@ class SpeechTranscriber:
                 compute_type,
             )
 
+            # One worker per concurrent transcribe_segments call; with the
+            # default single worker, parallel calls would just queue up.
             self._model = WhisperModel(
                 settings.WHISPER_MODEL,
                 device=device,
                 compute_type=compute_type,
+                num_workers=max(1, settings.WHISPER_CONCURRENCY),
             )
 
             logger.info("Whisper model loaded successfully")
@@ -135,6 +145,7 @@ class SpeechTranscriber:
         self,
         audio_path: Path,
         segments: list[SpeakerSegment],
+        audio: tuple[np.ndarray, int] | None = None,
     ) -> list[SpeakerSegment]:
         """Transcribe each diarized segment and populate its ``text`` field.
 
@@ -147,6 +158,9 @@ class SpeechTranscriber:
             audio_path: Path to the source audio file (WAV).
             segments:   Diarization segments to transcribe.  Modified
                         in-place **and** returned.
+            audio:      Optional ``(waveform, sample_rate)`` already read
+                        from *audio_path*, so callers transcribing several
+                        batches of the same file only decode it once.
 
         Returns:
             The same *segments* list with ``text`` fields filled in.
@@ -173,9 +187,11 @@ class SpeechTranscriber:
         )
 
         # Read the full audio file once to avoid repeated disk I/O
-        full_audio, sample_rate = await asyncio.to_thread(
-            sf.read, str(audio_path), dtype="float32",
-        )
+        if audio is None:
+            audio = await asyncio.to_thread(
+                sf.read, str(audio_path), dtype="float32",
+            )
+        full_audio, sample_rate = audio
 
         for idx, segment in enumerate(segments):
             try:
@@ -363,8 +379,7 @@ class SpeechTranscriber:
         def _run() -> str:
             buf = audio
             if sr != 16000:
-                import librosa  # noqa: WPS433
-                buf = librosa.resample(buf, orig_sr=sr, target_sr=16000)
+                buf = resample(buf, sr, 16000)
 
             with tempfile.NamedTemporaryFile(
                 suffix=".wav", delete=False,
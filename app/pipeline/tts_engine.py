@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +25,8 @@ import soundfile as sf
 import torch
 
 from app.config import settings
+from app.utils.buffer_pool import PCMBufferPool
+from app.utils.precision import autocast, torch_dtype
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +58,22 @@ class TTSEngine:
 
     Public methods are ``async`` and delegate blocking inference to
     ``asyncio.to_thread``.
+
+    Args:
+        buffer_pool: Shared PCM buffer pool used for WAV writes.  A private
+                     pool is created when ``None``.
+        dtype:       Inference precision on CUDA (``fp32``, ``fp16`` or
+                     ``bf16``).  Defaults to ``settings.INFERENCE_DTYPE``.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        buffer_pool: PCMBufferPool | None = None,
+        dtype: str | None = None,
+    ) -> None:
+        self._buffer_pool = buffer_pool or PCMBufferPool()
+        self._dtype: str = dtype or settings.INFERENCE_DTYPE
+        self._load_lock = threading.Lock()
         self._qwen_model: object | None = None
         self._mms_model: object | None = None
         self._mms_tokenizer: object | None = None
@@ -65,8 +81,9 @@ class TTSEngine:
         self._indicf5_vocoder: object | None = None
         self._device: str = "cuda" if torch.cuda.is_available() else "cpu"
         logger.debug(
-            "TTSEngine created (device=%s, qwen=%s, mms=%s, indicf5=%s)",
+            "TTSEngine created (device=%s, dtype=%s, qwen=%s, mms=%s, indicf5=%s)",
             self._device,
+            self._dtype,
             settings.QWEN_TTS_MODEL,
             settings.MMS_TTS_MODEL,
             settings.INDICF5_MODEL,
@@ -117,46 +134,60 @@ class TTSEngine:
     # Lazy model loading
     # ------------------------------------------------------------------
 
+    async def warmup(self) -> None:
+        """Load the default (Qwen3-TTS) model ahead of the first job.
+
+        No dummy generation is run: Qwen3-TTS needs a reference voice to
+        synthesise anything.
+        """
+        await asyncio.to_thread(self._ensure_qwen_model)
+
     def _ensure_qwen_model(self) -> None:
         """Load the Qwen3-TTS model on first call."""
         if self._qwen_model is not None:
             return
 
-        logger.info("Loading Qwen3-TTS model: %s on %s", settings.QWEN_TTS_MODEL, self._device)
-
-        try:
-            from qwen_tts import Qwen3TTSModel  # noqa: WPS433
-
-            dtype = torch.bfloat16 if self._device == "cuda" else torch.float32
-
-            load_kwargs: dict = {
-                "device_map": f"{self._device}:0" if self._device == "cuda" else self._device,
-                "dtype": dtype,
-            }
-            if self._device == "cuda":
-                try:
-                    import flash_attn  # noqa: F401, WPS433
-                    load_kwargs["attn_implementation"] = "flash_attention_2"
-                    logger.info("FlashAttention2 available — enabled")
-                except ImportError:
-                    logger.info("FlashAttention2 not installed — using default attention")
-
-            model_path = self._resolve_to_local(settings.QWEN_TTS_MODEL)
-            self._qwen_model = Qwen3TTSModel.from_pretrained(
-                model_path,
-                **load_kwargs,
-            )
-            logger.info("Qwen3-TTS model loaded successfully")
-
-        except ImportError:
-            raise RuntimeError(
-                "qwen-tts package not installed. Run: pip install qwen-tts"
-            )
-        except Exception as exc:
-            logger.error("Failed to load Qwen3-TTS model: %s", exc)
-            raise RuntimeError(
-                f"Cannot load Qwen3-TTS model '{settings.QWEN_TTS_MODEL}': {exc}"
-            ) from exc
+        # Segments may be synthesised from several worker threads at once;
+        # make sure only one of them loads the model.
+        with self._load_lock:
+            if self._qwen_model is not None:
+                return
+
+            logger.info("Loading Qwen3-TTS model: %s on %s", settings.QWEN_TTS_MODEL, self._device)
+
+            try:
+                from qwen_tts import Qwen3TTSModel  # noqa: WPS433
+
+                dtype = torch_dtype(self._dtype) if self._device == "cuda" else torch.float32
+
+                load_kwargs: dict = {
+                    "device_map": f"{self._device}:0" if self._device == "cuda" else self._device,
+                    "dtype": dtype,
+                }
+                if self._device == "cuda":
+                    try:
+                        import flash_attn  # noqa: F401, WPS433
+                        load_kwargs["attn_implementation"] = "flash_attention_2"
+                        logger.info("FlashAttention2 available — enabled")
+                    except ImportError:
+                        logger.info("FlashAttention2 not installed — using default attention")
+
+                model_path = self._resolve_to_local(settings.QWEN_TTS_MODEL)
+                self._qwen_model = Qwen3TTSModel.from_pretrained(
+                    model_path,
+                    **load_kwargs,
+                )
+                logger.info("Qwen3-TTS model loaded successfully")
+
+            except ImportError:
+                raise RuntimeError(
+                    "qwen-tts package not installed. Run: pip install qwen-tts"
+                )
+            except Exception as exc:
+                logger.error("Failed to load Qwen3-TTS model: %s", exc)
+                raise RuntimeError(
+                    f"Cannot load Qwen3-TTS model '{settings.QWEN_TTS_MODEL}': {exc}"
+                ) from exc
 
     def _ensure_mms_model(self) -> None:
         """Load the Meta MMS-TTS Bengali model on first call."""
@@ -323,39 +354,84 @@ class TTSEngine:
 
         return audio.astype(np.float32), sr
 
+    @torch.inference_mode()
+    def _encode_reference(
+        self,
+        ref_audio_path: str,
+        ref_text: Optional[str] = None,
+    ) -> object | None:
+        """Build the Qwen3-TTS prompt for a reference voice.
+
+        Returns ``None`` when the installed ``qwen-tts`` version cannot
+        build reusable prompts, in which case callers pass the reference
+        audio path to every generation as before.
+        """
+        self._ensure_qwen_model()
+        create_prompt = getattr(self._qwen_model, "create_voice_clone_prompt", None)
+        if create_prompt is None:
+            return None
+
+        prompt_kwargs: dict = {"ref_audio": ref_audio_path}
+        if ref_text:
+            prompt_kwargs["ref_text"] = ref_text
+            prompt_kwargs["x_vector_only_mode"] = False
+        else:
+            prompt_kwargs["x_vector_only_mode"] = True
+
+        prompt = create_prompt(**prompt_kwargs)
+        logger.info("Encoded reference voice: %s", Path(ref_audio_path).name)
+        return prompt
+
     # ------------------------------------------------------------------
     # Core synthesis — Qwen3-TTS (synchronous, run on thread)
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _clone_kwargs(
+        ref_audio_path: Optional[str],
+        ref_text: Optional[str],
+        voice_clone_prompt: object | None,
+    ) -> dict:
+        """Return the reference-voice arguments for ``generate_voice_clone``."""
+        if voice_clone_prompt is not None:
+            return {"voice_clone_prompt": voice_clone_prompt}
+
+        clone_kwargs: dict = {"ref_audio": ref_audio_path}
+        if ref_text:
+            clone_kwargs["ref_text"] = ref_text
+            clone_kwargs["x_vector_only_mode"] = False
+        else:
+            clone_kwargs["x_vector_only_mode"] = True
+        return clone_kwargs
+
+    @torch.inference_mode()
     def _synthesize_qwen(
         self,
         text: str,
         ref_audio_path: Optional[str] = None,
         ref_text: Optional[str] = None,
         language: Optional[str] = None,
+        voice_clone_prompt: object | None = None,
     ) -> tuple[np.ndarray, int]:
-        """Synchronous TTS inference via Qwen3TTSModel."""
+        """Synchronous TTS inference via Qwen3TTSModel.
+
+        When *voice_clone_prompt* (from :meth:`encode_reference`) is given
+        the reference voice is not re-encoded.
+        """
         self._ensure_qwen_model()
 
         lang = language if language else self._detect_language(text)
         logger.info("Qwen3-TTS language: %s", lang)
 
-        if ref_audio_path is None:
+        if ref_audio_path is None and voice_clone_prompt is None:
             raise ValueError(
                 "Qwen3-TTS requires a reference voice for synthesis. "
                 "Please select a saved voice or upload a reference audio file."
             )
 
-        clone_kwargs: dict = {
-            "text": text,
-            "language": lang,
-            "ref_audio": ref_audio_path,
-        }
-        if ref_text:
-            clone_kwargs["ref_text"] = ref_text
-            clone_kwargs["x_vector_only_mode"] = False
-        else:
-            clone_kwargs["x_vector_only_mode"] = True
+        clone_kwargs = self._clone_kwargs(ref_audio_path, ref_text, voice_clone_prompt)
+        clone_kwargs["text"] = text
+        clone_kwargs["language"] = lang
 
         wavs, sr = self._qwen_model.generate_voice_clone(**clone_kwargs)
 
@@ -365,6 +441,38 @@ class TTSEngine:
 
         return np.asarray(audio, dtype=np.float32).squeeze(), sr
 
+    @torch.inference_mode()
+    def _synthesize_qwen_batch(
+        self,
+        texts: list[str],
+        ref_audio_path: str,
+        ref_text: Optional[str] = None,
+        language: Optional[str] = None,
+        voice_clone_prompt: object | None = None,
+    ) -> tuple[list[np.ndarray], int]:
+        """Synchronous batched TTS inference via Qwen3TTSModel.
+
+        All *texts* are cloned from the same reference voice in a single
+        ``generate_voice_clone`` call, which pads them internally.
+        """
+        self._ensure_qwen_model()
+
+        langs = [language if language else self._detect_language(t) for t in texts]
+        logger.info("Qwen3-TTS batch of %d (languages: %s)", len(texts), sorted(set(langs)))
+
+        clone_kwargs = self._clone_kwargs(ref_audio_path, ref_text, voice_clone_prompt)
+        clone_kwargs["text"] = list(texts)
+        clone_kwargs["language"] = langs
+
+        wavs, sr = self._qwen_model.generate_voice_clone(**clone_kwargs)
+
+        audios: list[np.ndarray] = []
+        for audio in wavs:
+            if isinstance(audio, torch.Tensor):
+                audio = audio.cpu().float().numpy()
+            audios.append(np.asarray(audio, dtype=np.float32).squeeze())
+        return audios, sr
+
     # ------------------------------------------------------------------
     # Core synthesis — MMS-TTS Bengali (synchronous, run on thread)
     # ------------------------------------------------------------------
@@ -377,7 +485,7 @@ class TTSEngine:
 
         inputs = self._mms_tokenizer(text, return_tensors="pt").to(self._device)
 
-        with torch.no_grad():
+        with torch.inference_mode(), autocast(self._device, self._dtype):
             output = self._mms_model(**inputs)
 
         audio = output.waveform[0].cpu().float().numpy()
@@ -405,6 +513,7 @@ class TTSEngine:
             audio_np = audio_np.T                     # (channels, samples)
         return torch.from_numpy(audio_np), sr
 
+    @torch.inference_mode()
     def _synthesize_indicf5(
         self,
         text: str,
@@ -525,6 +634,12 @@ class TTSEngine:
         import librosa  # noqa: WPS433
         return librosa.effects.time_stretch(audio, rate=speed)
 
+    @staticmethod
+    def _time_stretch(audio: np.ndarray, rate: float) -> np.ndarray:
+        """Wrapper around ``librosa.effects.time_stretch`` for thread dispatch."""
+        import librosa  # noqa: WPS433
+        return librosa.effects.time_stretch(audio, rate=rate)
+
     @staticmethod
     def _apply_pitch(audio: np.ndarray, pitch: float, sr: int) -> np.ndarray:
         """Pitch-shift *audio* by *pitch* ratio (1.0 = no change)."""
@@ -538,6 +653,35 @@ class TTSEngine:
     # Public async interface
     # ------------------------------------------------------------------
 
+    async def encode_reference(
+        self,
+        reference_audio: Path,
+        ref_text: Optional[str] = None,
+    ) -> object | None:
+        """Encode a Qwen3-TTS reference voice once for reuse across calls.
+
+        Pass the result as ``reference_prompt`` to :meth:`synthesize`,
+        :meth:`synthesize_segment` or :meth:`synthesize_batch`.  The engine
+        does not keep the prompt (it may hold GPU tensors), so callers own
+        it and should drop it when their job finishes.
+
+        Args:
+            reference_audio: Path to the reference voice sample.
+            ref_text: Optional transcript of the reference audio.
+
+        Returns:
+            An opaque prompt object, or ``None`` if the installed
+            ``qwen-tts`` cannot build reusable prompts.
+
+        Raises:
+            FileNotFoundError: If *reference_audio* does not exist.
+        """
+        if not reference_audio.exists():
+            raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
+        return await asyncio.to_thread(
+            self._encode_reference, str(reference_audio), ref_text,
+        )
+
     async def synthesize(
         self,
         text: str,
@@ -548,6 +692,7 @@ class TTSEngine:
         language: Optional[str] = None,
         tts_model: str = MODEL_QWEN,
         ref_text: Optional[str] = None,
+        reference_prompt: object | None = None,
     ) -> Path:
         """Generate speech from text using the selected model.
 
@@ -562,10 +707,45 @@ class TTSEngine:
                        or ``"indicf5"``.
             ref_text: Transcript of the reference audio (used by IndicF5
                       and optionally by Qwen3-TTS).
+            reference_prompt: Qwen3-TTS prompt from
+                      :meth:`encode_reference`; skips re-encoding
+                      *reference_audio*.
 
         Returns:
             *output_path* after the file has been written.
         """
+        audio, sr = await self._generate(
+            text, reference_audio, speed, pitch, language, tts_model, ref_text,
+            reference_prompt,
+        )
+
+        # Write output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(self._buffer_pool.write_wav, output_path, audio, sr)
+        duration = len(audio) / sr
+        logger.info("Synthesized speech saved: %s (%.2fs, model=%s)", output_path.name, duration, tts_model)
+
+        return output_path
+
+    async def _generate(
+        self,
+        text: str,
+        reference_audio: Optional[Path],
+        speed: float,
+        pitch: float,
+        language: Optional[str],
+        tts_model: str,
+        ref_text: Optional[str],
+        reference_prompt: object | None = None,
+    ) -> tuple[np.ndarray, int]:
+        """Run the selected model plus speed/pitch post-processing.
+
+        Shared by :meth:`synthesize` and :meth:`synthesize_segment`; see
+        :meth:`synthesize` for the arguments.
+
+        Returns:
+            A ``(audio, sample_rate)`` tuple; nothing is written to disk.
+        """
         speed = max(0.5, min(2.0, speed))
         pitch = max(0.5, min(2.0, pitch))
 
@@ -588,7 +768,8 @@ class TTSEngine:
             if ref_path_str:
                 logger.info("Using reference audio for cloning: %s", reference_audio.name)
             audio, sr = await asyncio.to_thread(
-                self._synthesize_qwen, text, ref_path_str, ref_text, language
+                self._synthesize_qwen, text, ref_path_str, ref_text, language,
+                reference_prompt,
             )
 
         # Post-process speed and pitch
@@ -597,13 +778,7 @@ class TTSEngine:
         if abs(pitch - 1.0) > 0.01:
             audio = await asyncio.to_thread(self._apply_pitch, audio, pitch, sr)
 
-        # Write output
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        sf.write(str(output_path), audio, sr)
-        duration = len(audio) / sr
-        logger.info("Synthesized speech saved: %s (%.2fs, model=%s)", output_path.name, duration, tts_model)
-
-        return output_path
+        return audio, sr
 
     async def synthesize_segment(
         self,
@@ -613,33 +788,168 @@ class TTSEngine:
         target_duration: float,
         speed: float = 1.0,
         pitch: float = 1.0,
+        reference_prompt: object | None = None,
     ) -> Path:
         """Synthesize a speech segment and time-stretch to match *target_duration*.
 
-        Uses Qwen3-TTS (voice cloning) for pipeline voice replacement.
+        Uses Qwen3-TTS (voice cloning) for pipeline voice replacement.  The
+        generated audio is stretched in memory and written once; the parent
+        directory of *output_path* must already exist.  Pass the result of
+        :meth:`encode_reference` as *reference_prompt* to avoid encoding
+        the same reference voice for every segment.
         """
-        await self.synthesize(text, output_path, reference_audio, speed, pitch)
+        audio, sr = await self._generate(
+            text, reference_audio, speed, pitch, None, MODEL_QWEN, None,
+            reference_prompt,
+        )
+        return await self._fit_and_write(audio, sr, output_path, target_duration)
+
+    async def synthesize_batch(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        output_paths: list[Path],
+        target_durations: list[float],
+        speed: float = 1.0,
+        pitch: float = 1.0,
+        reference_prompt: object | None = None,
+    ) -> list[Path]:
+        """Synthesize several segments for one voice in a single model call.
+
+        Batched counterpart of :meth:`synthesize_segment`: the audio is
+        produced by :meth:`generate_batch` and each output is written to
+        its output path.
+
+        Args:
+            texts: Texts to synthesize.
+            reference_audio: Reference voice shared by every text.
+            output_paths: Destination WAV path per text; parent
+                directories must already exist.
+            target_durations: Desired duration in seconds per text.
+            speed: Speech speed multiplier (0.5-2.0).
+            pitch: Pitch adjustment multiplier (0.5-2.0).
+            reference_prompt: Qwen3-TTS prompt from :meth:`encode_reference`;
+                skips re-encoding *reference_audio*.
 
-        # Read back and measure actual duration
-        info = sf.info(str(output_path))
-        actual_duration = info.duration
+        Returns:
+            *output_paths* after all files have been written.
+
+        Raises:
+            ValueError: If the input lists differ in length or the
+                reference audio does not exist.
+        """
+        if len(output_paths) != len(texts):
+            raise ValueError("texts and output_paths must have the same length")
+
+        audios, sr = await self.generate_batch(
+            texts, reference_audio, target_durations, speed, pitch,
+            reference_prompt,
+        )
+        await asyncio.gather(*(
+            asyncio.to_thread(self._buffer_pool.write_wav, path, audio, sr)
+            for audio, path in zip(audios, output_paths)
+        ))
+        return list(output_paths)
+
+    async def generate_batch(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        target_durations: list[float],
+        speed: float = 1.0,
+        pitch: float = 1.0,
+        reference_prompt: object | None = None,
+    ) -> tuple[list[np.ndarray], int]:
+        """Generate several segments for one voice in memory.
+
+        All *texts* are generated by one Qwen3-TTS forward pass against the
+        same *reference_audio*, then each output is post-processed and
+        stretched to its target duration.  Nothing is written to disk.
+        Callers should group segments by speaker and keep batches to
+        similar lengths so that little padding is wasted.
+
+        Args:
+            texts: Texts to synthesize.
+            reference_audio: Reference voice shared by every text.
+            target_durations: Desired duration in seconds per text.
+            speed: Speech speed multiplier (0.5-2.0).
+            pitch: Pitch adjustment multiplier (0.5-2.0).
+            reference_prompt: Qwen3-TTS prompt from :meth:`encode_reference`;
+                skips re-encoding *reference_audio*.
+
+        Returns:
+            A ``(audios, sample_rate)`` tuple with one 1-D float32 array per
+            text, in input order.
+
+        Raises:
+            ValueError: If the input lists differ in length or the
+                reference audio does not exist.
+        """
+        if len(texts) != len(target_durations):
+            raise ValueError("texts and target_durations must have the same length")
+        if not texts:
+            return [], 0
+        if not reference_audio.exists():
+            raise ValueError(
+                "Qwen3-TTS requires a reference voice for synthesis. "
+                f"Reference audio not found: {reference_audio}"
+            )
+
+        speed = max(0.5, min(2.0, speed))
+        pitch = max(0.5, min(2.0, pitch))
+
+        audios, sr = await asyncio.to_thread(
+            self._synthesize_qwen_batch, texts, str(reference_audio), None, None,
+            reference_prompt,
+        )
+
+        async def _finish(audio: np.ndarray, target: float) -> np.ndarray:
+            if abs(speed - 1.0) > 0.01:
+                audio = await asyncio.to_thread(self._apply_speed, audio, speed)
+            if abs(pitch - 1.0) > 0.01:
+                audio = await asyncio.to_thread(self._apply_pitch, audio, pitch, sr)
+            return await self._fit_duration(audio, sr, target)
+
+        fitted = await asyncio.gather(*(
+            _finish(audio, target)
+            for audio, target in zip(audios, target_durations)
+        ))
+        return list(fitted), sr
+
+    async def _fit_and_write(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        output_path: Path,
+        target_duration: float,
+    ) -> Path:
+        """Time-stretch *audio* towards *target_duration* and write it once."""
+        audio = await self._fit_duration(audio, sr, target_duration)
+        await asyncio.to_thread(self._buffer_pool.write_wav, output_path, audio, sr)
+        return output_path
+
+    async def _fit_duration(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        target_duration: float,
+    ) -> np.ndarray:
+        """Time-stretch *audio* towards *target_duration* if it is >0.1s off."""
+        actual_duration = len(audio) / sr
 
         if actual_duration <= 0 or abs(actual_duration - target_duration) <= 0.1:
-            return output_path
+            return audio
 
         # Time-stretch to match target
         stretch_ratio = actual_duration / target_duration
         stretch_ratio = max(0.5, min(2.0, stretch_ratio))
 
-        audio, sr = sf.read(str(output_path), dtype="float32")
-        import librosa  # noqa: WPS433
-        audio = librosa.effects.time_stretch(audio, rate=stretch_ratio)
-        sf.write(str(output_path), audio, sr)
+        audio = await asyncio.to_thread(self._time_stretch, audio, stretch_ratio)
 
-        logger.info(
+        logger.debug(
             "Time-stretched segment: %.2fs -> %.2fs (ratio=%.3f)",
             actual_duration,
             target_duration,
             stretch_ratio,
         )
-        return output_path
+        return audio
@@ -8,6 +8,7 @@ that jobs survive application restarts.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
@@ -248,11 +249,11 @@ class JobManager:
             return
 
         loaded = 0
-        for child in self._jobs_root.iterdir():
-            if not child.is_dir():
-                continue
+        with os.scandir(self._jobs_root) as entries:
+            job_ids = [entry.name for entry in entries if entry.is_dir()]
 
-            job = self.load_job(child.name)
+        for job_id in job_ids:
+            job = self.load_job(job_id)
             if job is not None:
                 self._jobs[job.job_id] = job
                 loaded += 1
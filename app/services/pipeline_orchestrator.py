@@ -7,23 +7,43 @@ workflow driven by :class:`JobManager` state transitions.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import re
+import time
 from pathlib import Path
 
+import numpy as np
+import soundfile as sf
+
 from app.config import settings
-from app.models import JobStatus, VoiceAssignment
+from app.models import JobStatus, SpeakerSegment, VoiceAssignment
 from app.pipeline.aligner import AudioAligner
 from app.pipeline.audio_extractor import AudioExtractor
 from app.pipeline.diarizer import SpeakerDiarizer
 from app.pipeline.merger import AudioMerger
 from app.pipeline.separator import AudioSeparator
 from app.pipeline.transcriber import SpeechTranscriber
-from app.pipeline.tts_engine import TTSEngine
+from app.pipeline.tts_engine import MODEL_QWEN, TTSEngine
 from app.services.job_manager import JobManager
 from app.utils.audio_utils import get_duration
+from app.utils.buffer_pool import PCMBufferPool
+from app.utils.precision import configure_backends
 
 logger = logging.getLogger(__name__)
 
+# Number of duration-sorted segments synthesised together per bucket.
+_TTS_BUCKET_SIZE: int = 16
+
+# File names that identify the accompaniment track in a job directory.
+_MUSIC_NAME_RE = re.compile(r"accompaniment|music|no_vocals", re.IGNORECASE)
+
+# In-stage progress is only persisted when it advanced by at least this
+# much, or when this many seconds passed since the last write.
+_PROGRESS_MIN_DELTA: float = 0.01
+_PROGRESS_MIN_INTERVAL_S: float = 0.5
+
 
 class PipelineOrchestrator:
     """Orchestrate the full voice-clone processing pipeline.
@@ -35,16 +55,49 @@ class PipelineOrchestrator:
     """
 
     def __init__(self, job_manager: JobManager) -> None:
+        if settings.TORCH_FAST_KERNELS:
+            configure_backends()
+
         self.job_manager = job_manager
+        self.buffer_pool = PCMBufferPool()
+        # Last persisted in-stage progress per job as (progress, monotonic time).
+        self._progress_state: dict[str, tuple[float, float]] = {}
 
         self.extractor = AudioExtractor()
         self.separator = AudioSeparator()
         self.diarizer = SpeakerDiarizer()
         self.transcriber = SpeechTranscriber()
-        self.tts_engine = TTSEngine()
-        self.aligner = AudioAligner()
+        self.tts_engine = TTSEngine(
+            buffer_pool=self.buffer_pool, dtype=settings.INFERENCE_DTYPE,
+        )
+        self.aligner = AudioAligner(buffer_pool=self.buffer_pool)
         self.merger = AudioMerger()
 
+    # ------------------------------------------------------------------
+    # Startup
+    # ------------------------------------------------------------------
+
+    async def warmup(self) -> None:
+        """Load every pipeline model so the first job does not pay for it.
+
+        Models are loaded one after another to avoid competing for GPU
+        memory and disk bandwidth.  A model that fails to load is logged
+        and skipped; it will be retried lazily when a job needs it.
+        """
+        for name, module in (
+            ("separator", self.separator),
+            ("diarizer", self.diarizer),
+            ("transcriber", self.transcriber),
+            ("tts", self.tts_engine),
+        ):
+            started = time.monotonic()
+            try:
+                await module.warmup()
+            except Exception:
+                logger.exception("Warmup of %s failed; it will load on first use", name)
+                continue
+            logger.info("Warmed up %s in %.1fs", name, time.monotonic() - started)
+
     # ------------------------------------------------------------------
     # Upload analysis pipeline
     # ------------------------------------------------------------------
@@ -53,9 +106,11 @@ class PipelineOrchestrator:
         """Run the full analysis pipeline on an uploaded media file.
 
         Stages: extract audio -> separate vocals/music -> diarize speakers
-        -> transcribe segments.  On completion the job enters
-        ``AWAITING_VOICE_ASSIGNMENT`` so the user can map speakers to
-        reference voices.
+        -> transcribe segments.  Diarization starts as soon as the vocals
+        stem is written, while the accompaniment is still being finalised,
+        and each speaker's segments are then transcribed concurrently.  On
+        completion the job enters ``AWAITING_VOICE_ASSIGNMENT`` so the
+        user can map speakers to reference voices.
 
         This method is intended to be launched as a background task.
 
@@ -76,6 +131,7 @@ class PipelineOrchestrator:
                 job_id,
                 status=JobStatus.EXTRACTING_AUDIO,
                 progress=0.05,
+                original_input_path=str(file_path),
             )
 
             audio_wav = job_dir / "input" / "audio.wav"
@@ -102,23 +158,49 @@ class PipelineOrchestrator:
             music_dir.mkdir(parents=True, exist_ok=True)
 
             logger.info("Job %s: separating vocals and music", job_id)
-            vocals_path, accompaniment_path = await self.separator.separate(
-                audio_wav, job_dir
+            vocals_ready: asyncio.Future[Path] = (
+                asyncio.get_running_loop().create_future()
+            )
+            separate_task = asyncio.create_task(
+                self.separator.separate(
+                    audio_wav, job_dir, vocals_ready=vocals_ready,
+                )
             )
 
+            # Diarization only needs the vocals stem, so start it as soon as
+            # that is written and let the accompaniment finish alongside.
+            try:
+                await asyncio.wait(
+                    {separate_task, vocals_ready},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not vocals_ready.done():
+                    vocals_path, _ = await separate_task
+                else:
+                    vocals_path = vocals_ready.result()
+            except BaseException:
+                await self._cancel_tasks([separate_task])
+                raise
+
             # --- 3. Speaker diarization ------------------------------------
             self.job_manager.update_job(
                 job_id,
                 status=JobStatus.DIARIZING,
                 progress=0.35,
+                vocals_path=str(vocals_path),
             )
 
             logger.info("Job %s: running speaker diarization", job_id)
-            segments = await self.diarizer.diarize(
-                vocals_path,
-                min_speakers=settings.MIN_SPEAKERS,
-                max_speakers=settings.MAX_SPEAKERS,
-            )
+            try:
+                segments = await self.diarizer.diarize(
+                    vocals_path,
+                    min_speakers=settings.MIN_SPEAKERS,
+                    max_speakers=settings.MAX_SPEAKERS,
+                )
+                _, accompaniment_path = await separate_task
+            except BaseException:
+                await self._cancel_tasks([separate_task])
+                raise
 
             segments = self.diarizer.merge_short_segments(
                 segments,
@@ -131,11 +213,15 @@ class PipelineOrchestrator:
                 job_id,
                 status=JobStatus.TRANSCRIBING,
                 progress=0.50,
+                music_path=str(accompaniment_path),
             )
 
             logger.info("Job %s: transcribing %d segments", job_id, len(segments))
-            segments = await self.transcriber.transcribe_segments(
-                vocals_path, segments
+            vocals = await asyncio.to_thread(
+                sf.read, str(vocals_path), dtype="float32",
+            )
+            segments = await self._transcribe_by_speaker(
+                vocals_path, vocals, segments,
             )
 
             # --- 5. Build speaker list and finalise -------------------------
@@ -177,7 +263,8 @@ class PipelineOrchestrator:
 
         Stages: generate speech per segment -> time-align to original
         timing -> merge with original background music -> (optionally)
-        rebuild video.
+        rebuild video.  Each segment is queued for alignment as soon as
+        it has been synthesised, so the first two stages overlap.
 
         This method is intended to be launched as a background task.
 
@@ -206,10 +293,39 @@ class PipelineOrchestrator:
                 ref_path = job_dir / "references" / assignment.reference_audio_filename
                 ref_map[assignment.speaker_id] = ref_path
 
+            # Encode each reference voice once instead of once per segment.
+            # The prompts live only for this job and are released with it.
+            prompt_map: dict[str, object | None] = {}
+            prompts_by_path: dict[Path, object | None] = {}
+            for speaker_id, ref_path in ref_map.items():
+                if not ref_path.exists():
+                    continue
+                if ref_path not in prompts_by_path:
+                    prompts_by_path[ref_path] = await self.tts_engine.encode_reference(
+                        ref_path
+                    )
+                prompt_map[speaker_id] = prompts_by_path[ref_path]
+
             # --- 2. Synthesise speech for every segment ---------------------
             segments = job.segments
             total_segments = len(segments)
-            speech_segment_dicts: list[dict] = []
+
+            starts = np.fromiter(
+                (s.start_time for s in segments), np.float64, total_segments,
+            )
+            ends = np.fromiter(
+                (s.end_time for s in segments), np.float64, total_segments,
+            )
+            durs = ends - starts
+
+            # Plan the work up front: the first segment for each (text,
+            # voice, length) key is synthesised, and later repeats of the
+            # same line (choruses, disclaimers) reuse its audio.
+            segments_dir = job_dir / "segments"
+            segments_dir.mkdir(parents=True, exist_ok=True)
+            to_synthesise: list[int] = []
+            duplicates_of: dict[int, list[int]] = {}
+            first_for_key: dict[tuple[str, str, float], int] = {}
 
             for idx, segment in enumerate(segments):
                 ref_audio = ref_map.get(segment.speaker_id)
@@ -222,51 +338,161 @@ class PipelineOrchestrator:
                     )
                     continue
 
-                target_duration = segment.end_time - segment.start_time
-                seg_output = job_dir / "segments" / f"{idx}.wav"
-
-                logger.debug(
-                    "Job %s: synthesising segment %d/%d (speaker=%s, duration=%.2fs)",
-                    job_id,
-                    idx + 1,
-                    total_segments,
-                    segment.speaker_id,
-                    target_duration,
+                cache_key = (
+                    segment.text.strip(),
+                    str(ref_audio),
+                    round(float(durs[idx]), 1),
                 )
-
-                await self.tts_engine.synthesize_segment(
-                    text=segment.text,
-                    reference_audio=ref_audio,
-                    output_path=seg_output,
-                    target_duration=target_duration,
-                )
-
-                speech_segment_dicts.append(
-                    {
-                        "audio_path": str(seg_output),
-                        "target_start": segment.start_time,
-                        "target_end": segment.end_time,
-                        "speaker_id": segment.speaker_id,
-                        "target_duration": target_duration,
+                first = first_for_key.setdefault(cache_key, idx)
+                if first == idx:
+                    to_synthesise.append(idx)
+                else:
+                    duplicates_of.setdefault(first, []).append(idx)
+
+            semaphore = asyncio.Semaphore(max(1, settings.TTS_CONCURRENCY))
+
+            # Synthesised audio is kept in memory and handed to the aligner
+            # through a bounded queue, so time-stretching overlaps with
+            # synthesis of the remaining segments instead of waiting for
+            # all of them.  Segment WAVs are only written for debugging.
+            align_queue: asyncio.Queue[int | None] = asyncio.Queue(
+                maxsize=max(1, settings.ALIGN_QUEUE_DEPTH),
+            )
+            raw_audio: dict[int, tuple[np.ndarray, int]] = {}
+            aligned_by_idx: dict[int, dict] = {}
+
+            async def _align_worker() -> None:
+                while True:
+                    idx = await align_queue.get()
+                    if idx is None:
+                        break
+                    audio, sr = raw_audio.pop(idx)
+                    entry = {
+                        "audio": audio,
+                        "sr": sr,
+                        "target_start": float(starts[idx]),
+                        "target_end": float(ends[idx]),
+                        "speaker_id": segments[idx].speaker_id,
+                        "target_duration": float(durs[idx]),
                     }
+                    await self.aligner.align_segment_entry(entry, idx, segments_dir)
+                    if settings.DEBUG_SEGMENTS:
+                        aligned_path = (
+                            segments_dir
+                            / f"aligned_{entry['speaker_id']}_{idx:04d}.wav"
+                        )
+                        await asyncio.to_thread(
+                            self.buffer_pool.write_wav,
+                            aligned_path, entry["audio"], sr,
+                        )
+                        entry["aligned_path"] = aligned_path
+                    aligned_by_idx[idx] = entry
+
+            async def _queue_for_alignment(target: int | None) -> None:
+                # The queue is bounded, so a put blocks while the worker is
+                # behind.  If the worker has died nothing will drain it;
+                # wait on both and surface the worker's error instead of
+                # hanging.
+                if not align_task.done():
+                    try:
+                        align_queue.put_nowait(target)
+                        return
+                    except asyncio.QueueFull:
+                        put = asyncio.ensure_future(align_queue.put(target))
+                        await asyncio.wait(
+                            {put, align_task},
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if put.done():
+                            return
+                        put.cancel()
+                align_task.result()
+                raise RuntimeError("Alignment worker stopped unexpectedly")
+
+            # Checked once per job: the per-batch message joins segment
+            # numbers, which is wasted work when DEBUG is off.
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            async def _synthesise_batch(batch: list[int]) -> None:
+                speaker_id = segments[batch[0]].speaker_id
+                async with semaphore:
+                    if debug_enabled:
+                        logger.debug(
+                            "Job %s: synthesising %d segment(s) for speaker %s "
+                            "(%s of %d)",
+                            job_id,
+                            len(batch),
+                            speaker_id,
+                            ", ".join(str(idx + 1) for idx in batch),
+                            total_segments,
+                        )
+                    audios, sr = await self.tts_engine.generate_batch(
+                        texts=[segments[idx].text for idx in batch],
+                        reference_audio=ref_map[speaker_id],
+                        target_durations=[float(durs[idx]) for idx in batch],
+                        reference_prompt=prompt_map.get(speaker_id),
+                    )
+                # Repeats of a line are queued with their source's audio.
+                for idx, audio in zip(batch, audios):
+                    for target in (idx, *duplicates_of.get(idx, ())):
+                        raw_audio[target] = (audio, sr)
+                        if settings.DEBUG_SEGMENTS:
+                            await asyncio.to_thread(
+                                self.buffer_pool.write_wav,
+                                segments_dir / f"{target}.wav", audio, sr,
+                            )
+                        await _queue_for_alignment(target)
+
+            batch_size = max(1, settings.TTS_BATCH_SIZE)
+            align_task = asyncio.create_task(_align_worker())
+            try:
+                # Synthesise in buckets of similar target duration.  Within
+                # a bucket, each speaker's segments go to the model as one
+                # batch (up to TTS_BATCH_SIZE) and batches run concurrently;
+                # progress is written per bucket.
+                to_synthesise.sort(key=lambda i: durs[i])
+                for offset in range(0, len(to_synthesise), _TTS_BUCKET_SIZE):
+                    bucket = to_synthesise[offset:offset + _TTS_BUCKET_SIZE]
+                    by_speaker: dict[str, list[int]] = {}
+                    for idx in bucket:
+                        by_speaker.setdefault(segments[idx].speaker_id, []).append(idx)
+                    batches = [
+                        group[i:i + batch_size]
+                        for group in by_speaker.values()
+                        for i in range(0, len(group), batch_size)
+                    ]
+                    results = await asyncio.gather(
+                        *(_synthesise_batch(batch) for batch in batches),
+                        return_exceptions=True,
+                    )
+                    for result in results:
+                        if isinstance(result, BaseException):
+                            raise result
+
+                    # Progress: 0.70 -> 0.85 across segments.
+                    done = offset + len(bucket)
+                    seg_progress = 0.70 + (0.15 * done / len(to_synthesise))
+                    self._maybe_update_progress(job_id, seg_progress)
+
+                # --- 3. Finish aligning segments to original timing ---------
+                self._progress_state.pop(job_id, None)
+                self.job_manager.update_job(
+                    job_id,
+                    status=JobStatus.ALIGNING,
+                    progress=0.85,
                 )
 
-                # Progress: 0.70 -> 0.85 across segments.
-                if total_segments > 0:
-                    seg_progress = 0.70 + (0.15 * (idx + 1) / total_segments)
-                    self.job_manager.update_job(job_id, progress=seg_progress)
-
-            # --- 3. Align segments to original timing -----------------------
-            self.job_manager.update_job(
-                job_id,
-                status=JobStatus.ALIGNING,
-                progress=0.85,
-            )
+                await _queue_for_alignment(None)
+                await align_task
+            except BaseException:
+                await self._cancel_tasks([align_task])
+                raise
 
-            segments_dir = job_dir / "segments"
-            logger.info("Job %s: aligning %d segments", job_id, len(speech_segment_dicts))
-            aligned_segments = await self.aligner.align_all_segments(
-                speech_segment_dicts, segments_dir
+            aligned_segments = [
+                aligned_by_idx[idx] for idx in sorted(aligned_by_idx)
+            ]
+            logger.info(
+                "Job %s: aligned %d segments", job_id, len(aligned_segments),
             )
 
             # --- 4. Merge aligned speech with background music --------------
@@ -280,7 +506,7 @@ class PipelineOrchestrator:
             total_duration = get_duration(original_audio)
 
             # Locate the music / accompaniment track.
-            music_path = self._find_music_path(job_dir)
+            music_path = self._find_music_path(job_dir, job.music_path)
 
             output_dir = job_dir / "output"
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -294,21 +520,22 @@ class PipelineOrchestrator:
                 total_duration=total_duration,
             )
 
-            # --- 5. Rebuild video if the original input was video -----------
-            output_file = str(final_wav)
-            input_file = self._find_original_input(job_dir)
-
-            if input_file is not None and self.extractor.is_video(input_file):
-                final_video = output_dir / "final.mp4"
-                logger.info("Job %s: rebuilding video with new audio", job_id)
-                await self.merger.rebuild_video(
-                    input_file, final_wav, final_video
-                )
-                output_file = str(final_video)
+            # --- 5 + 6. Export formats and rebuild video (one FFmpeg run) ---
+            input_file = self._find_original_input(
+                job_dir, job.original_input_path
+            )
+            if input_file is not None and not self.extractor.is_video(input_file):
+                input_file = None
 
-            # --- 6. Export additional formats --------------------------------
-            logger.info("Job %s: exporting additional formats", job_id)
-            await self.merger.export_formats(final_wav, output_dir)
+            logger.info(
+                "Job %s: exporting formats%s",
+                job_id,
+                " and rebuilding video" if input_file is not None else "",
+            )
+            outputs = await self.merger.finalize(
+                final_wav, output_dir, original_video=input_file,
+            )
+            output_file = str(outputs.get("video", final_wav))
 
             # --- 7. Mark complete -------------------------------------------
             self.job_manager.update_job(
@@ -321,6 +548,7 @@ class PipelineOrchestrator:
             logger.info("Job %s: voice replacement complete", job_id)
 
         except Exception as exc:
+            self._progress_state.pop(job_id, None)
             logger.exception("Job %s: voice replacement failed", job_id)
             self.job_manager.update_job(
                 job_id,
@@ -364,8 +592,6 @@ class PipelineOrchestrator:
         Raises:
             Exception: Re-raised after marking the job as ``FAILED``.
         """
-        from app.pipeline.tts_engine import MODEL_QWEN
-
         try:
             job_dir = self.job_manager.get_job_dir(job_id)
             output_dir = job_dir / "output"
@@ -393,7 +619,7 @@ class PipelineOrchestrator:
             )
 
             # Export to MP3 as well.
-            await self.merger.export_formats(output_path, output_dir)
+            await self.merger.finalize(output_path, output_dir)
 
             self.job_manager.update_job(
                 job_id,
@@ -418,15 +644,102 @@ class PipelineOrchestrator:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _maybe_update_progress(self, job_id: str, progress: float) -> None:
+        """Persist in-stage *progress* for *job_id* at a throttled rate.
+
+        Every :meth:`JobManager.update_job` call rewrites ``job.json``, so
+        per-item progress inside a stage is only written when it advanced
+        by ``_PROGRESS_MIN_DELTA`` or ``_PROGRESS_MIN_INTERVAL_S`` seconds
+        have passed since the last write.  Stage transitions keep calling
+        ``update_job`` directly.
+
+        Args:
+            job_id:   The job identifier.
+            progress: Current progress as a fraction ``[0.0, 1.0]``.
+        """
+        now = time.monotonic()
+        last = self._progress_state.get(job_id)
+        if last is not None:
+            last_progress, last_time = last
+            if (
+                progress - last_progress < _PROGRESS_MIN_DELTA
+                and now - last_time <= _PROGRESS_MIN_INTERVAL_S
+            ):
+                return
+
+        self._progress_state[job_id] = (progress, now)
+        self.job_manager.update_job(job_id, progress=progress)
+
+    async def _transcribe_by_speaker(
+        self,
+        vocals_path: Path,
+        vocals: tuple[np.ndarray, int],
+        segments: list[SpeakerSegment],
+    ) -> list[SpeakerSegment]:
+        """Transcribe *segments* as concurrent per-speaker batches.
+
+        Segments are grouped by ``speaker_id`` and each group is handed to
+        the transcriber as its own call.  At most
+        ``settings.WHISPER_CONCURRENCY`` groups run at once, matching the
+        number of Whisper workers, so concurrent streams do not exhaust
+        GPU memory.
+
+        Args:
+            vocals_path: Path to the isolated vocals track.
+            vocals:      ``(waveform, sample_rate)`` read from
+                         *vocals_path*, shared by every group.
+            segments:    Segments to transcribe.
+
+        Returns:
+            The transcribed segments sorted by ``start_time``.
+        """
+        groups: dict[str, list[SpeakerSegment]] = {}
+        for segment in segments:
+            groups.setdefault(segment.speaker_id, []).append(segment)
+
+        semaphore = asyncio.Semaphore(max(1, settings.WHISPER_CONCURRENCY))
+
+        async def _run(group: list[SpeakerSegment]) -> list[SpeakerSegment]:
+            async with semaphore:
+                return await self.transcriber.transcribe_segments(
+                    vocals_path, group, audio=vocals,
+                )
+
+        tasks = [asyncio.create_task(_run(g)) for g in groups.values()]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            await self._cancel_tasks(tasks)
+            raise
+
+        transcribed = [seg for group in results for seg in group]
+        transcribed.sort(key=lambda s: s.start_time)
+        return transcribed
+
     @staticmethod
-    def _find_music_path(job_dir: Path) -> Path:
+    async def _cancel_tasks(tasks: list[asyncio.Task]) -> None:
+        """Cancel *tasks* and wait until all of them have finished.
+
+        Their results and exceptions are discarded; the caller is already
+        propagating the error that made them unnecessary.
+        """
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _find_music_path(job_dir: Path, recorded: str | None = None) -> Path:
         """Locate the accompaniment/music track inside the job directory.
 
-        The separator may place the file under ``music/`` or ``vocals/``
-        with varying names.  This helper performs a best-effort search.
+        The path recorded on the job after separation is used when it
+        still exists.  Otherwise (e.g. jobs created before it was stored)
+        the separator may have placed the file under ``music/`` or
+        ``vocals/`` with varying names, and this helper performs a
+        best-effort search.
 
         Args:
-            job_dir: Root directory of the job.
+            job_dir:  Root directory of the job.
+            recorded: ``JobInfo.music_path`` for the job, if set.
 
         Returns:
             Path to the music/accompaniment audio file.
@@ -434,6 +747,9 @@ class PipelineOrchestrator:
         Raises:
             FileNotFoundError: If no accompaniment file can be found.
         """
+        if recorded and Path(recorded).is_file():
+            return Path(recorded)
+
         candidates = [
             job_dir / "music",
             job_dir / "vocals",
@@ -443,46 +759,52 @@ class PipelineOrchestrator:
         for parent in candidates:
             if not parent.exists():
                 continue
-            for child in parent.iterdir():
-                name_lower = child.name.lower()
-                if child.is_file() and (
-                    "accompaniment" in name_lower
-                    or "music" in name_lower
-                    or "no_vocals" in name_lower
-                ):
-                    return child
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.is_file() and _MUSIC_NAME_RE.search(entry.name):
+                        return Path(entry.path)
 
         # Fallback: look for any WAV file inside music/.
         music_dir = job_dir / "music"
         if music_dir.exists():
-            for child in music_dir.iterdir():
-                if child.suffix.lower() == ".wav":
-                    return child
+            with os.scandir(music_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(".wav"):
+                        return Path(entry.path)
 
         raise FileNotFoundError(
             f"No accompaniment/music track found in {job_dir}"
         )
 
     @staticmethod
-    def _find_original_input(job_dir: Path) -> Path | None:
-        """Return the first non-WAV file in the job's ``input/`` folder.
+    def _find_original_input(
+        job_dir: Path, recorded: str | None = None,
+    ) -> Path | None:
+        """Return the original upload for the job.
 
-        The original upload is saved with its original filename.  The
-        pipeline also creates ``audio.wav`` in the same folder, so we
-        skip that file.
+        The path recorded on the job at upload time is used when it still
+        exists.  Otherwise this falls back to the first non-WAV file in
+        the job's ``input/`` folder: the original upload is saved with its
+        original filename, and the pipeline also creates ``audio.wav`` in
+        the same folder, so we skip that file.
 
         Args:
-            job_dir: Root directory of the job.
+            job_dir:  Root directory of the job.
+            recorded: ``JobInfo.original_input_path`` for the job, if set.
 
         Returns:
             Path to the original upload, or ``None`` if not found.
         """
+        if recorded and Path(recorded).is_file():
+            return Path(recorded)
+
         input_dir = job_dir / "input"
         if not input_dir.exists():
             return None
 
-        for child in input_dir.iterdir():
-            if child.is_file() and child.name != "audio.wav":
-                return child
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name != "audio.wav":
+                    return Path(entry.path)
 
         return None
@@ -1,27 +1,52 @@
 """Voice profile management with in-memory cache and file-system persistence.
 
 Provides CRUD operations for saved voice profiles. Every mutation is
-written through to a ``profile.json`` file inside the voice's storage
-directory so that profiles survive application restarts.
+appended as a single JSON line to a ``profile.log`` file inside the voice's
+storage directory, which is periodically compacted into a ``profile.json``
+snapshot, so that profiles survive application restarts.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 from app.config import settings
 from app.models import VoiceProfile
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
+# Number of appended ``profile.log`` entries after which a voice's log is
+# folded back into its ``profile.json`` snapshot.
+_COMPACT_EVERY: int = 32
+
 
 class VoiceManager:
     """Manage voice profiles with in-memory cache backed by JSON files."""
 
     def __init__(self) -> None:
         self._voices: dict[str, VoiceProfile] = {}
+        # Last persisted field values per voice, used to log only the
+        # fields that changed and to skip unchanged saves.
+        self._last_saved: dict[str, dict] = {}
+        # Entries appended to each voice's profile.log since its snapshot.
+        self._log_entries: dict[str, int] = {}
         self._voices_root: Path = settings.VOICES_DIR
         self._voices_root.mkdir(parents=True, exist_ok=True)
         self._load_all_voices()
@@ -77,6 +102,8 @@ class VoiceManager:
             if not self._voice_dir(voice_id).exists():
                 return False
         self._voices.pop(voice_id, None)
+        self._last_saved.pop(voice_id, None)
+        self._log_entries.pop(voice_id, None)
         voice_dir = self._voice_dir(voice_id)
         if voice_dir.exists():
             shutil.rmtree(voice_dir, ignore_errors=True)
@@ -100,27 +127,87 @@ class VoiceManager:
     # ------------------------------------------------------------------
 
     def save_voice(self, voice: VoiceProfile) -> None:
-        """Serialise *voice* to its ``profile.json`` file on disk."""
+        """Persist the fields of *voice* that changed since the last save.
+
+        The changed fields are appended as one JSON line to ``profile.log``.
+        On the first save in this process, and after every
+        ``_COMPACT_EVERY`` appends, the full profile is also written to a
+        temporary file that is atomically renamed over ``profile.json``,
+        after which the log is truncated.  The change is always logged
+        before the snapshot is written, so replaying a log left behind by
+        an interrupted compaction reproduces the snapshot's values.  A
+        failed write makes the next save compact, so nothing is appended
+        after a torn line.
+        """
+        data = voice.model_dump(mode="json")
+        last = self._last_saved.get(voice.voice_id)
+        if last == data:
+            return
+        if last is None:
+            changed = data
+        else:
+            changed = {k: v for k, v in data.items() if last.get(k) != v}
         voice_dir = self._voice_dir(voice.voice_id)
         voice_dir.mkdir(parents=True, exist_ok=True)
-        profile_file = voice_dir / "profile.json"
+        log_file = voice_dir / "profile.log"
+        entries = self._log_entries.get(voice.voice_id, 0) + 1
         try:
-            profile_file.write_text(
-                voice.model_dump_json(indent=2), encoding="utf-8"
-            )
+            with open(log_file, "ab") as fh:
+                fh.write(_json_dumps(changed) + b"\n")
+            if last is None or entries >= _COMPACT_EVERY:
+                tmp_file = voice_dir / "profile.json.tmp"
+                tmp_file.write_bytes(_json_dumps(data))
+                os.replace(tmp_file, voice_dir / "profile.json")
+                log_file.unlink(missing_ok=True)
+                entries = 0
         except OSError:
             logger.exception("Failed to save voice %s to disk", voice.voice_id)
+            # The log may now end in a torn line; make the next save
+            # rewrite the snapshot and start a fresh log.
+            self._last_saved.pop(voice.voice_id, None)
+            return
+        self._last_saved[voice.voice_id] = data
+        self._log_entries[voice.voice_id] = entries
 
     def load_voice(self, voice_id: str) -> VoiceProfile | None:
-        """Deserialise a voice profile from its ``profile.json`` on disk."""
-        profile_file = self._voice_dir(voice_id) / "profile.json"
-        if not profile_file.exists():
-            return None
+        """Deserialise a voice profile from its files on disk.
+
+        The ``profile.json`` snapshot is read first and every line of
+        ``profile.log`` is then applied over it in order.  Both files are
+        only ever written by :meth:`save_voice`, so the merged data is
+        trusted and the model is built with ``model_construct`` instead of
+        running full validation.  Only ``created_at`` needs converting back
+        from its ISO string.
+        """
+        voice_dir = self._voice_dir(voice_id)
+        profile_file = voice_dir / "profile.json"
+        log_file = voice_dir / "profile.log"
         try:
-            raw = profile_file.read_text(encoding="utf-8")
-            return VoiceProfile.model_validate_json(raw)
+            data: dict = {}
+            if profile_file.exists():
+                data = _json_loads(profile_file.read_bytes())
+            if log_file.exists():
+                for line in log_file.read_bytes().splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        data.update(_json_loads(line))
+                    except ValueError:
+                        # A crash or full disk mid-append leaves a torn
+                        # line; keep the snapshot and every intact entry.
+                        logger.warning(
+                            "Skipping unreadable entry in %s", log_file,
+                        )
+            if not data:
+                return None
+            created_at = data.get("created_at")
+            if isinstance(created_at, str):
+                data["created_at"] = datetime.fromisoformat(
+                    created_at.replace("Z", "+00:00")
+                )
+            return VoiceProfile.model_construct(**data)
         except Exception:
-            logger.exception("Failed to load voice from %s", profile_file)
+            logger.exception("Failed to load voice from %s", voice_dir)
             return None
 
     # ------------------------------------------------------------------
@@ -131,14 +218,22 @@ class VoiceManager:
         return self._voices_root / voice_id
 
     def _load_all_voices(self) -> None:
-        """Scan voices directory and load all persisted profiles into memory."""
+        """Scan voices directory and load all persisted profiles into memory.
+
+        Profiles are read and validated on a thread pool so that disk reads
+        for many voices overlap instead of running one after another.
+        """
         if not self._voices_root.exists():
             return
+        with os.scandir(self._voices_root) as entries:
+            voice_ids = [entry.name for entry in entries if entry.is_dir()]
+        if not voice_ids:
+            return
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(voice_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            voices = list(pool.map(self.load_voice, voice_ids))
         loaded = 0
-        for child in self._voices_root.iterdir():
-            if not child.is_dir():
-                continue
-            voice = self.load_voice(child.name)
+        for voice in voices:
             if voice is not None:
                 self._voices[voice.voice_id] = voice
                 loaded += 1
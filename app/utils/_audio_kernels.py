@@ -0,0 +1,82 @@
+"""Numba-compiled kernels for :mod:`app.utils.audio_utils`.
+
+Numba is an optional dependency.  This module imports it unconditionally,
+so it is only imported lazily by :func:`app.utils.audio_utils._kernels`,
+which falls back to the NumPy implementations when the import fails.
+Kernels are compiled on their first call and cached on disk.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(nogil=True, cache=True)
+def silent_runs(
+    audio: np.ndarray,
+    frame_size: int,
+    min_frames: int,
+    energy_threshold: float,
+) -> np.ndarray:
+    """Return ``(start_frame, end_frame)`` pairs of silent runs in *audio*.
+
+    Frame energy is accumulated and compared against *energy_threshold*
+    (the squared RMS threshold times *frame_size*) in a single pass, so
+    neither a squared temporary nor a per-frame ``sqrt`` is needed.
+    """
+    num_frames = audio.shape[0] // frame_size
+    runs = np.empty((num_frames // min_frames + 1, 2), np.int64)
+    count = 0
+    region_start = -1
+
+    for i in range(num_frames):
+        energy = 0.0
+        base = i * frame_size
+        for j in range(frame_size):
+            sample = audio[base + j]
+            energy += sample * sample
+        if energy < energy_threshold:
+            if region_start < 0:
+                region_start = i
+        elif region_start >= 0:
+            if i - region_start >= min_frames:
+                runs[count, 0] = region_start
+                runs[count, 1] = i
+                count += 1
+            region_start = -1
+
+    if region_start >= 0 and num_frames - region_start >= min_frames:
+        runs[count, 0] = region_start
+        runs[count, 1] = num_frames
+        count += 1
+
+    return runs[:count]
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def normalize_and_fade(
+    audio: np.ndarray,
+    gain: float,
+    fade_in_samples: int,
+    fade_out_samples: int,
+) -> None:
+    """Scale, clip and fade *audio* in place.
+
+    The fade factors reproduce the ``np.linspace`` curves used by
+    :func:`app.utils.audio_utils.apply_fade`, and are applied after the
+    clip as they are there.
+    """
+    length = audio.shape[0]
+    fade_out_start = length - fade_out_samples
+    for i in prange(length):
+        value = audio[i] * gain
+        if value > 1.0:
+            value = 1.0
+        elif value < -1.0:
+            value = -1.0
+        if i < fade_in_samples:
+            value *= i / (fade_in_samples - 1) if fade_in_samples > 1 else 0.0
+        if i >= fade_out_start and fade_out_samples > 1:
+            value *= 1.0 - (i - fade_out_start) / (fade_out_samples - 1)
+        audio[i] = value
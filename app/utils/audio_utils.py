@@ -8,18 +8,47 @@ All functions are stateless and operate on numpy arrays or file paths.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import math
+import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import numpy as np
 import soundfile as sf
 
 from app.config import settings
 
+try:
+    import numpy_rms
+
+    _HAS_NUMPY_RMS = True
+except ImportError:  # pragma: no cover - numpy-rms is optional
+    _HAS_NUMPY_RMS = False
+
+try:
+    import soxr
+
+    _HAS_SOXR = True
+except ImportError:  # pragma: no cover - soxr is optional
+    _HAS_SOXR = False
+
 logger = logging.getLogger(__name__)
 
+# Leading FFmpeg arguments shared by all conversions: overwrite outputs,
+# never read stdin and only log errors.
+_FFMPEG_BASE_ARGS: tuple[str, ...] = (
+    "-hide_banner",
+    "-loglevel", "error",
+    "-nostdin",
+    "-y",
+)
+
+# Frames read per block when down-mixing multichannel files.
+_READ_BLOCK_FRAMES: int = 1 << 16
+
 
 # ---------------------------------------------------------------------------
 # I/O
@@ -33,8 +62,8 @@ async def load_audio(
     """Load an audio file and optionally resample.
 
     Stereo files are automatically down-mixed to mono.  If *sr* is given and
-    differs from the file's native sample rate, the audio is resampled using
-    ``librosa``.
+    differs from the file's native sample rate, the audio is resampled with
+    :func:`resample`.
 
     Args:
         path: Path to the audio file (WAV, FLAC, OGG, etc.).
@@ -50,21 +79,68 @@ async def load_audio(
     if not path.exists():
         raise FileNotFoundError(f"Audio file not found: {path}")
 
-    audio, native_sr = await asyncio.to_thread(sf.read, str(path), "float32")
-
-    # Stereo -> mono
-    if audio.ndim > 1:
-        audio = audio.mean(axis=1)
+    audio, native_sr = await asyncio.to_thread(_read_mono, path)
 
     # Resample
     if sr is not None and sr != native_sr:
-        import librosa  # noqa: WPS433
-        audio = await asyncio.to_thread(
-            librosa.resample, audio, orig_sr=native_sr, target_sr=sr,
-        )
+        audio = await asyncio.to_thread(resample, audio, native_sr, sr)
         native_sr = sr
 
-    return audio.astype(np.float32), native_sr
+    # Already float32 and contiguous on every path, so this does not copy
+    return np.ascontiguousarray(audio, dtype=np.float32), native_sr
+
+
+def resample(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Resample a 1-D audio array from *orig_sr* to *target_sr*.
+
+    Uses ``soxr`` directly when it is installed and ``librosa`` otherwise,
+    so callers never pay the ``librosa`` import just to resample.  This is
+    a synchronous blocking call -- wrap in ``asyncio.to_thread`` if calling
+    from async code.
+
+    Args:
+        audio: 1-D float audio array.
+        orig_sr: Sample rate of *audio*.
+        target_sr: Desired sample rate.
+
+    Returns:
+        The resampled array.
+    """
+    if _HAS_SOXR:
+        return soxr.resample(audio, orig_sr, target_sr, "HQ")
+    return _librosa().resample(audio, orig_sr=orig_sr, target_sr=target_sr)
+
+
+@functools.cache
+def _librosa():
+    """Import ``librosa`` on first use; the import takes several hundred ms."""
+    import librosa  # noqa: WPS433
+    return librosa
+
+
+def _read_mono(path: Path) -> tuple[np.ndarray, int]:
+    """Read *path* as mono float32, down-mixing block by block.
+
+    Multichannel files are read in blocks of ``_READ_BLOCK_FRAMES`` frames
+    and each block is averaged straight into a preallocated mono buffer,
+    so the full interleaved multichannel array is never held in memory.
+    Blocks are read into one reused buffer rather than a fresh copy each.
+    """
+    with sf.SoundFile(str(path)) as f:
+        if f.channels == 1:
+            return f.read(dtype="float32"), f.samplerate
+
+        mono = np.empty(f.frames, dtype=np.float32)
+        offset = 0
+        for block in f.blocks(out=_block_buffer(f)):
+            n = len(block)
+            np.mean(block, axis=1, out=mono[offset:offset + n])
+            offset += n
+        # Only slice when the header over-reported the frame count, so the
+        # usual result owns its buffer rather than being a view.
+        if offset < len(mono):
+            mono = mono[:offset]
+        return mono, f.samplerate
 
 
 async def save_audio(
@@ -90,6 +166,143 @@ async def save_audio(
     return path
 
 
+async def process_audio_stream(
+    input_path: Path,
+    output_path: Path,
+    sr: Optional[int] = None,
+    *,
+    target_db: float = -3.0,
+    fade_in: float = 0.01,
+    fade_out: float = 0.01,
+) -> Path:
+    """Load, resample, peak-normalize and fade a file in fixed-size blocks.
+
+    Produces the same result as :func:`load_audio` followed by
+    :func:`normalize_audio` and :func:`apply_fade`, but streams the file
+    through in blocks of ``_READ_BLOCK_FRAMES`` frames and writes the
+    output WAV as it goes, so peak memory no longer grows with the file
+    length.  The input is read twice: once to find its peak and once to
+    process it.  The peak is measured before resampling, so a resampled
+    output can land slightly off *target_db*; the safety clip still
+    bounds it to ``[-1.0, 1.0]``.
+
+    Args:
+        input_path: Source audio file.
+        output_path: Destination WAV file path.
+        sr: Target sample rate.  ``None`` keeps the native rate.
+        target_db: Target peak level in dBFS.
+        fade_in: Fade-in duration in seconds.
+        fade_out: Fade-out duration in seconds.
+
+    Returns:
+        *output_path* after writing the file.
+
+    Raises:
+        FileNotFoundError: If *input_path* does not exist.
+        RuntimeError: If resampling is needed and ``soxr`` is not installed.
+    """
+    if not input_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {input_path}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(
+        _process_stream_sync,
+        input_path, output_path, sr, target_db, fade_in, fade_out,
+    )
+    logger.debug("Processed audio stream: %s -> %s", input_path.name, output_path.name)
+    return output_path
+
+
+def _process_stream_sync(
+    input_path: Path,
+    output_path: Path,
+    sr: Optional[int],
+    target_db: float,
+    fade_in: float,
+    fade_out: float,
+) -> None:
+    """Blocking implementation of :func:`process_audio_stream`."""
+    with sf.SoundFile(str(input_path)) as src:
+        native_sr = src.samplerate
+        out_sr = sr or native_sr
+
+        # First pass: peak of the mono signal
+        peak = 0.0
+        for block in _iter_mono_blocks(src):
+            if len(block):
+                peak = max(peak, float(-block.min()), float(block.max()))
+        gain = 1.0 if peak < 1e-8 else _db_to_amplitude(target_db) / peak
+        src.seek(0)
+
+        resampler = None
+        if out_sr != native_sr:
+            if not _HAS_SOXR:
+                raise RuntimeError("Streaming resampling requires the soxr package")
+            resampler = soxr.ResampleStream(
+                native_sr, out_sr, 1, dtype="float32", quality="HQ",
+            )
+
+        expected = src.frames * out_sr // native_sr
+        fade_in_samples = min(int(fade_in * out_sr), expected // 2)
+        fade_out_samples = min(int(fade_out * out_sr), expected // 2)
+        fade_in_curve = _fade_curve(fade_in_samples, True)
+        fade_out_curve = _fade_curve(fade_out_samples, False)
+
+        with sf.SoundFile(
+            str(output_path), "w", samplerate=out_sr, channels=1,
+        ) as dst:
+            position = 0
+            # The last fade_out_samples are held back until the end of the
+            # stream is known.
+            tail = np.empty(0, dtype=np.float32)
+
+            def emit(chunk: np.ndarray) -> None:
+                nonlocal position, tail
+                np.multiply(chunk, np.float32(gain), out=chunk)
+                np.clip(chunk, -1.0, 1.0, out=chunk)
+                if position < fade_in_samples:
+                    n = min(fade_in_samples - position, len(chunk))
+                    chunk[:n] *= fade_in_curve[position:position + n]
+                position += len(chunk)
+                if fade_out_samples:
+                    chunk = np.concatenate((tail, chunk))
+                    split = max(0, len(chunk) - fade_out_samples)
+                    tail = chunk[split:]
+                    chunk = chunk[:split]
+                dst.write(chunk)
+
+            for block in _iter_mono_blocks(src):
+                if resampler is not None:
+                    block = resampler.resample_chunk(block)
+                emit(block)
+            if resampler is not None:
+                emit(resampler.resample_chunk(
+                    np.empty(0, dtype=np.float32), last=True,
+                ))
+
+            if len(tail):
+                tail *= fade_out_curve[fade_out_samples - len(tail):]
+                dst.write(tail)
+
+
+def _iter_mono_blocks(f: sf.SoundFile) -> Iterator[np.ndarray]:
+    """Yield successive mono float32 blocks of ``_READ_BLOCK_FRAMES`` frames.
+
+    Blocks are read into a single reused buffer, so each yielded block is
+    only valid until the next one is requested.
+    """
+    for block in f.blocks(out=_block_buffer(f)):
+        if block.shape[1] == 1:
+            yield block[:, 0]
+        else:
+            yield block.mean(axis=1)
+
+
+def _block_buffer(f: sf.SoundFile) -> np.ndarray:
+    """Allocate a float32 ``(frames, channels)`` read buffer for *f*."""
+    return np.empty((_READ_BLOCK_FRAMES, f.channels), dtype=np.float32)
+
+
 # ---------------------------------------------------------------------------
 # Metadata
 # ---------------------------------------------------------------------------
@@ -99,7 +312,8 @@ def get_duration(path: Path) -> float:
     """Return the duration of an audio file in seconds.
 
     Uses ``soundfile.info`` which reads only the file header, so this is
-    very fast even for large files.
+    very fast even for large files.  Results are cached per path, mtime and
+    size, so repeated calls for an unchanged file cost a single ``stat``.
 
     Args:
         path: Path to the audio file.
@@ -108,13 +322,23 @@ def get_duration(path: Path) -> float:
         Duration in seconds.  Returns ``0.0`` if the file cannot be read.
     """
     try:
-        info = sf.info(str(path))
-        return info.duration
+        st = os.stat(path)
+        return _cached_duration(str(path), st.st_mtime_ns, st.st_size)
     except Exception as exc:
         logger.warning("Could not read duration for %s: %s", path, exc)
         return 0.0
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_duration(path: str, mtime_ns: int, size: int) -> float:
+    """Read the duration from the header of *path*.
+
+    *mtime_ns* and *size* are only part of the cache key, so that a file
+    rewritten in place is read again.
+    """
+    return sf.info(path).duration
+
+
 # ---------------------------------------------------------------------------
 # Format conversion
 # ---------------------------------------------------------------------------
@@ -145,14 +369,65 @@ def convert_format(input_path: Path, output_path: Path) -> Path:
 
     cmd = [
         settings.FFMPEG_PATH,
-        "-y",
+        *_FFMPEG_BASE_ARGS,
         "-i", str(input_path),
         str(output_path),
     ]
+    _run_ffmpeg(cmd)
+
+    logger.info("Converted: %s -> %s", input_path.name, output_path.name)
+    return output_path
+
+
+def convert_formats_batch(pairs: list[tuple[Path, Path]]) -> list[Path]:
+    """Convert several audio files with a single FFmpeg process.
+
+    Every input is opened by the same FFmpeg invocation and its first audio
+    stream is mapped to the matching output, so a batch of small files pays
+    the process start-up cost once instead of once per file.  Output formats
+    are inferred from the output extensions.  This is a synchronous blocking
+    call -- wrap in ``asyncio.to_thread`` if calling from async code.
+
+    Args:
+        pairs: ``(input_path, output_path)`` tuples to convert.
+
+    Returns:
+        The output paths, in the same order as *pairs*.
+
+    Raises:
+        FileNotFoundError: If any input path does not exist.
+        RuntimeError: If FFmpeg returns a non-zero exit code.
+    """
+    if not pairs:
+        return []
+
+    for input_path, output_path in pairs:
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    cmd = [settings.FFMPEG_PATH, *_FFMPEG_BASE_ARGS]
+    for input_path, _ in pairs:
+        cmd += ["-i", str(input_path)]
+    for index, (_, output_path) in enumerate(pairs):
+        cmd += ["-map", f"{index}:a:0", str(output_path)]
+    _run_ffmpeg(cmd)
+
+    logger.info("Converted %d file(s) in one FFmpeg run", len(pairs))
+    return [output_path for _, output_path in pairs]
+
+
+def _run_ffmpeg(cmd: list[str]) -> None:
+    """Run an FFmpeg command, raising ``RuntimeError`` on failure.
+
+    Only stderr is captured; with ``-loglevel error`` it holds just the
+    error messages rather than the full progress log.
+    """
     result = subprocess.run(
         cmd,
-        capture_output=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         check=False,
     )
@@ -163,9 +438,6 @@ def convert_format(input_path: Path, output_path: Path) -> Path:
             f"FFmpeg conversion failed with exit code {result.returncode}: {result.stderr}"
         )
 
-    logger.info("Converted: %s -> %s", input_path.name, output_path.name)
-    return output_path
-
 
 # ---------------------------------------------------------------------------
 # Array operations
@@ -221,17 +493,21 @@ def normalize_audio(
     Returns:
         A normalized copy of the audio array.
     """
-    peak = np.max(np.abs(audio))
+    # Two reductions over the input instead of materialising np.abs(audio)
+    peak = float(max(-audio.min(), audio.max())) if len(audio) else 0.0
     if peak < 1e-8:
         return audio.copy()
 
-    target_linear = 10.0 ** (target_db / 20.0)
+    target_linear = _db_to_amplitude(target_db)
     gain = target_linear / peak
 
-    normalized = audio * gain
+    # Scale and clip in place on a single float32 copy
+    normalized = audio.astype(np.float32, copy=True)
+    np.multiply(normalized, np.float32(gain), out=normalized)
 
     # Hard-clip as safety net (should not be needed if target_db < 0)
-    return np.clip(normalized, -1.0, 1.0).astype(np.float32)
+    np.clip(normalized, -1.0, 1.0, out=normalized)
+    return normalized
 
 
 def apply_fade(
@@ -258,16 +534,71 @@ def apply_fade(
     fade_out_samples = min(int(fade_out * sr), length // 2)
 
     if fade_in_samples > 0:
-        fade_in_curve = np.linspace(0.0, 1.0, fade_in_samples, dtype=np.float32)
-        audio[:fade_in_samples] *= fade_in_curve
+        audio[:fade_in_samples] *= _fade_curve(fade_in_samples, True)
 
     if fade_out_samples > 0:
-        fade_out_curve = np.linspace(1.0, 0.0, fade_out_samples, dtype=np.float32)
-        audio[-fade_out_samples:] *= fade_out_curve
+        audio[-fade_out_samples:] *= _fade_curve(fade_out_samples, False)
 
     return audio
 
 
+def normalize_and_fade(
+    audio: np.ndarray,
+    sr: int,
+    target_db: float = -3.0,
+    fade_in: float = 0.01,
+    fade_out: float = 0.01,
+) -> np.ndarray:
+    """Peak-normalize audio and apply fades in a single pass.
+
+    Equivalent to ``apply_fade(normalize_audio(audio, target_db), sr,
+    fade_in, fade_out)``.  When Numba is installed the gain, clip and fade
+    curves are applied by one compiled, multi-threaded kernel instead of
+    three separate passes over the array.
+
+    Args:
+        audio: 1-D float32 audio array.
+        sr: Sample rate.
+        target_db: Target peak level in dBFS.
+        fade_in: Fade-in duration in seconds.
+        fade_out: Fade-out duration in seconds.
+
+    Returns:
+        A normalized copy of the audio with fades applied.
+    """
+    kernels = _kernels()
+    if kernels is None:
+        return apply_fade(normalize_audio(audio, target_db), sr, fade_in, fade_out)
+
+    out = np.array(audio, dtype=np.float32)
+    length = len(out)
+    peak = float(max(-out.min(), out.max())) if length else 0.0
+    gain = 1.0 if peak < 1e-8 else _db_to_amplitude(target_db) / peak
+
+    kernels.normalize_and_fade(
+        out,
+        gain,
+        min(int(fade_in * sr), length // 2),
+        min(int(fade_out * sr), length // 2),
+    )
+    return out
+
+
+@functools.lru_cache(maxsize=64)
+def _fade_curve(n: int, rising: bool) -> np.ndarray:
+    """Return a cached, read-only linear fade curve of *n* samples.
+
+    The fade lengths used by callers are few and fixed (they derive from the
+    sample rate and fade duration), so the curves are built once and shared.
+    """
+    if rising:
+        curve = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    else:
+        curve = np.linspace(1.0, 0.0, n, dtype=np.float32)
+    curve.setflags(write=False)
+    return curve
+
+
 # ---------------------------------------------------------------------------
 # Signal analysis
 # ---------------------------------------------------------------------------
@@ -276,6 +607,9 @@ def apply_fade(
 def compute_rms(audio: np.ndarray) -> float:
     """Compute the root-mean-square energy of an audio signal.
 
+    Contiguous 1-D float32 input is handed to the SIMD ``numpy-rms``
+    extension when it is installed.
+
     Args:
         audio: 1-D audio array.
 
@@ -284,7 +618,17 @@ def compute_rms(audio: np.ndarray) -> float:
     """
     if len(audio) == 0:
         return 0.0
-    return float(np.sqrt(np.mean(audio.astype(np.float64) ** 2)))
+    if (
+        _HAS_NUMPY_RMS
+        and audio.dtype == np.float32
+        and audio.ndim == 1
+        and audio.flags.c_contiguous
+    ):
+        return float(numpy_rms.rms(audio, window_size=len(audio))[0])
+    # Accumulate in float64 (as the squared-mean formula did) without
+    # materialising a float64 copy; integer input would otherwise overflow.
+    energy = np.einsum("i,i->", audio, audio, dtype=np.float64)
+    return math.sqrt(float(energy) / len(audio))
 
 
 def detect_silence(
@@ -297,7 +641,8 @@ def detect_silence(
 
     A region is considered "silent" when its frame-level RMS energy stays
     below *threshold_db* for at least *min_duration* seconds.  Analysis is
-    performed in non-overlapping frames of 10 ms.
+    performed in non-overlapping frames of 10 ms.  When Numba is installed
+    the frame scan runs as a compiled kernel that releases the GIL.
 
     Args:
         audio: 1-D audio array.
@@ -313,7 +658,6 @@ def detect_silence(
     if len(audio) == 0:
         return []
 
-    threshold_linear = 10.0 ** (threshold_db / 20.0)
     frame_size = max(1, int(0.01 * sr))  # 10 ms frames
     min_frames = max(1, int(min_duration / 0.01))
 
@@ -321,37 +665,65 @@ def detect_silence(
     if num_frames == 0:
         return []
 
-    # Compute per-frame RMS
+    # A frame is silent when its RMS is below the linear threshold, i.e.
+    # when its sum of squares is below threshold_power * frame_size.
+    energy_threshold = _db_to_power(threshold_db) * frame_size
+
+    kernels = _kernels()
+    if kernels is not None:
+        runs = kernels.silent_runs(
+            np.ascontiguousarray(audio, dtype=np.float32),
+            frame_size,
+            min_frames,
+            energy_threshold,
+        )
+        return [(start, end) for start, end in (runs * frame_size / sr).tolist()]
+
+    # Compute per-frame energy without building a squared temporary
     trimmed = audio[: num_frames * frame_size]
     frames = trimmed.reshape(num_frames, frame_size)
-    frame_rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+    frame_energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float64)
 
     # Find silent frames
-    is_silent = frame_rms < threshold_linear
+    is_silent = frame_energy < energy_threshold
 
-    # Group contiguous silent frames into regions
-    silent_regions: list[tuple[float, float]] = []
-    region_start: int | None = None
+    # Group contiguous silent frames into regions: +1 edges mark the start
+    # of a run and -1 edges the frame just after it ends.
+    edges = np.diff(
+        is_silent.view(np.int8), prepend=np.int8(0), append=np.int8(0),
+    )
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= min_frames
 
-    for i, silent in enumerate(is_silent):
-        if silent:
-            if region_start is None:
-                region_start = i
-        else:
-            if region_start is not None:
-                region_length = i - region_start
-                if region_length >= min_frames:
-                    start_sec = region_start * frame_size / sr
-                    end_sec = i * frame_size / sr
-                    silent_regions.append((start_sec, end_sec))
-                region_start = None
-
-    # Handle trailing silence
-    if region_start is not None:
-        region_length = num_frames - region_start
-        if region_length >= min_frames:
-            start_sec = region_start * frame_size / sr
-            end_sec = num_frames * frame_size / sr
-            silent_regions.append((start_sec, end_sec))
-
-    return silent_regions
+    return list(zip(
+        (starts[keep] * frame_size / sr).tolist(),
+        (ends[keep] * frame_size / sr).tolist(),
+    ))
+
+
+@functools.lru_cache(maxsize=32)
+def _db_to_amplitude(db: float) -> float:
+    """Convert a dBFS level to a linear amplitude, caching common levels."""
+    return 10.0 ** (db / 20.0)
+
+
+@functools.lru_cache(maxsize=32)
+def _db_to_power(db: float) -> float:
+    """Convert a dBFS level to a linear power (squared amplitude) ratio."""
+    return 10.0 ** (db / 10.0)
+
+
+@functools.cache
+def _kernels():
+    """Import the Numba kernels on first use, or return ``None`` without Numba.
+
+    Importing Numba takes the better part of a second, so it is deferred
+    until a kernel is first needed; each kernel is then compiled on its
+    first call.
+    """
+    try:
+        from app.utils import _audio_kernels  # noqa: WPS433
+    except ImportError:
+        return None
+    return _audio_kernels
@@ -0,0 +1,125 @@
+"""Reusable PCM byte buffers for segment WAV writes.
+
+Synthesising and aligning a long job writes thousands of short WAV files.
+Converting each one to 16-bit PCM allocates (and immediately frees) a
+buffer of a few hundred KB; this pool hands those buffers back out instead
+so the allocator is not hit once per segment.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+# Buffer sizes are rounded up to a multiple of this many bytes so that
+# segments of similar length share a bucket.
+_BUCKET_BYTES: int = 64 * 1024
+
+
+class PCMBufferPool:
+    """Thread-safe pool of ``bytearray`` buffers bucketed by size.
+
+    Buffers are grouped by their size rounded up to the next multiple of
+    64 KB.  :meth:`acquire` returns a pooled buffer from the matching
+    bucket when one is free and allocates a new one otherwise;
+    :meth:`release` returns it to the pool.  At most *max_per_bucket*
+    idle buffers are kept per bucket so that memory is not retained for
+    one-off sizes.
+
+    Typical usage::
+
+        pool = PCMBufferPool()
+        pool.write_wav(output_path, audio, sr)
+    """
+
+    def __init__(self, max_per_bucket: int = 4) -> None:
+        self._buckets: dict[int, list[bytearray]] = {}
+        self._max_per_bucket = max_per_bucket
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def acquire(self, nbytes: int) -> bytearray:
+        """Return a buffer of at least *nbytes* bytes.
+
+        Args:
+            nbytes: Minimum required buffer size in bytes.
+
+        Returns:
+            A ``bytearray`` whose length is *nbytes* rounded up to the
+            bucket size.  Its contents are undefined.
+        """
+        size = self._bucket_size(nbytes)
+        with self._lock:
+            free = self._buckets.get(size)
+            if free:
+                return free.pop()
+        return bytearray(size)
+
+    def release(self, buf: bytearray) -> None:
+        """Return *buf* to the pool for reuse.
+
+        Args:
+            buf: A buffer previously obtained from :meth:`acquire`.
+        """
+        size = len(buf)
+        with self._lock:
+            free = self._buckets.setdefault(size, [])
+            if len(free) < self._max_per_bucket:
+                free.append(buf)
+
+    def write_wav(self, path: Path, audio: np.ndarray, sr: int) -> Path:
+        """Write *audio* to *path* as 16-bit PCM WAV via a pooled buffer.
+
+        The float samples are clipped, scaled and rounded to nearest (as
+        libsndfile does) in a pooled ``float32`` scratch buffer, then
+        stored into an ``int16`` view of a second pooled buffer that is
+        handed to ``soundfile``.  Both buffers are released once the file
+        has been written, so no per-call array is allocated.  This is a
+        blocking call -- wrap in ``asyncio.to_thread`` if calling from
+        async code.
+
+        Args:
+            path:  Destination WAV file path.
+            audio: 1-D float audio array in ``[-1.0, 1.0]``.
+            sr:    Sample rate.
+
+        Returns:
+            *path* after writing the file.
+        """
+        n_samples = len(audio)
+        scratch_buf = self.acquire(n_samples * 4)
+        buf = self.acquire(n_samples * 2)
+        scratch = np.frombuffer(
+            memoryview(scratch_buf), dtype=np.float32, count=n_samples,
+        )
+        pcm = np.frombuffer(memoryview(buf), dtype=np.int16, count=n_samples)
+        try:
+            np.clip(audio, -1.0, 1.0, out=scratch)
+            np.multiply(scratch, np.float32(32767.0), out=scratch)
+            np.rint(scratch, out=scratch)
+            np.copyto(pcm, scratch, casting="unsafe")
+            sf.write(str(path), pcm, sr, subtype="PCM_16")
+        finally:
+            del scratch, pcm
+            self.release(scratch_buf)
+            self.release(buf)
+        return path
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _bucket_size(nbytes: int) -> int:
+        """Round *nbytes* up to the next multiple of the bucket size."""
+        nbytes = max(nbytes, 1)
+        return -(-nbytes // _BUCKET_BYTES) * _BUCKET_BYTES
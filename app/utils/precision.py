@@ -0,0 +1,77 @@
+"""Inference precision helpers shared by the torch-based pipeline modules.
+
+``settings.INFERENCE_DTYPE`` names the precision (``fp32``, ``fp16`` or
+``bf16``) used for model weights and forward passes on CUDA.  CPU inference
+always runs in float32.  :func:`configure_backends` applies the
+process-wide torch backend options behind ``settings.TORCH_FAST_KERNELS``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from typing import ContextManager
+
+# INFERENCE_DTYPE values mapped to ``torch`` dtype attribute names.
+_TORCH_DTYPES: dict[str, str] = {
+    "fp32": "float32",
+    "fp16": "float16",
+    "bf16": "bfloat16",
+}
+
+
+def torch_dtype(name: str):
+    """Return the ``torch.dtype`` for an ``INFERENCE_DTYPE`` value.
+
+    Args:
+        name: One of ``"fp32"``, ``"fp16"`` or ``"bf16"`` (case-insensitive).
+
+    Returns:
+        The matching ``torch.dtype``.
+
+    Raises:
+        ValueError: If *name* is not a supported precision.
+    """
+    import torch  # noqa: WPS433
+
+    try:
+        return getattr(torch, _TORCH_DTYPES[name.lower()])
+    except KeyError:
+        raise ValueError(
+            f"Unsupported inference dtype {name!r}; "
+            f"expected one of {sorted(_TORCH_DTYPES)}"
+        ) from None
+
+
+def autocast(device: str, name: str) -> ContextManager:
+    """Return an autocast context for forward passes on *device*.
+
+    Reduced precision only applies on CUDA; for ``fp32`` or any other
+    device a no-op context is returned.
+
+    Args:
+        device: Device the model runs on (``"cuda"``, ``"cpu"``, ...).
+        name:   An ``INFERENCE_DTYPE`` value.
+
+    Returns:
+        A context manager to wrap the forward pass in.
+    """
+    if device != "cuda" or name.lower() == "fp32":
+        return contextlib.nullcontext()
+
+    import torch  # noqa: WPS433
+
+    return torch.autocast(device_type="cuda", dtype=torch_dtype(name))
+
+
+def configure_backends() -> None:
+    """Enable the faster, inference-only torch backend options.
+
+    Lets cuDNN benchmark and cache the fastest convolution algorithm for
+    each input shape, and allows TF32 for float32 matmuls on Ampere and
+    newer GPUs.  Both are process-wide, so they also apply to the Demucs
+    and pyannote models, not just TTS.
+    """
+    import torch  # noqa: WPS433
+
+    torch.backends.cudnn.benchmark = True
+    torch.set_float32_matmul_precision("high")
@@ -5,6 +5,7 @@ Usage:
     python scripts/download_models.py                   # download all
     python scripts/download_models.py --model whisper    # download one
     python scripts/download_models.py --models-dir D:\\models --token hf_xxx
+    python scripts/download_models.py --jobs 1           # one model at a time
 
 Models are cached under ``<models-dir>/huggingface/`` and
 ``<models-dir>/torch/`` using the standard HuggingFace Hub and
@@ -13,9 +14,12 @@ in your ``.env`` and the app will use local models only.
 """
 
 import argparse
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 # ---------------------------------------------------------------------------
 # Ensure project root is on sys.path so we can read .env
@@ -104,21 +108,31 @@ def setup_env(models_dir: Path) -> None:
     (models_dir / "torch").mkdir(parents=True, exist_ok=True)
 
 
+@functools.cache
+def hf_hub():
+    """Import ``huggingface_hub`` once.
+
+    It reads ``HF_HOME`` at import time, so this must only be called after
+    :func:`setup_env`.
+    """
+    import huggingface_hub
+    return huggingface_hub
+
+
 def download_hf_snapshot(repo_id: str, token: str | None) -> str:
     """Download a full HF repo snapshot. Returns the cached path."""
-    from huggingface_hub import snapshot_download
-    path = snapshot_download(repo_id, token=token)
+    path = hf_hub().snapshot_download(repo_id, token=token, max_workers=8)
     return path
 
 
 def download_hf_files(repo_id: str, filenames: list[str], token: str | None) -> list[str]:
     """Download specific files from a HF repo. Returns cached paths."""
-    from huggingface_hub import hf_hub_download
-    paths = []
-    for fname in filenames:
-        path = hf_hub_download(repo_id, filename=fname, token=token)
-        paths.append(path)
-    return paths
+    hf_hub_download = hf_hub().hf_hub_download
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(
+            lambda fname: hf_hub_download(repo_id, filename=fname, token=token),
+            filenames,
+        ))
 
 
 def download_demucs(model_name: str) -> None:
@@ -132,15 +146,27 @@ def download_demucs(model_name: str) -> None:
 # ---------------------------------------------------------------------------
 
 def download_model(key: str, spec: dict, token: str | None) -> bool:
-    """Download a single model. Returns True on success."""
-    print(f"\n{'='*60}")
-    print(f"  {spec['label']}")
-    print(f"{'='*60}")
+    """Download a single model. Returns True on success.
+
+    Models may be downloaded concurrently, so the report for each one is
+    collected and printed as a single block once it finishes.
+    """
+    lines: list[str] = []
+    ok = _download_model(spec, token, lines.append)
+    print("\n".join(lines), flush=True)
+    return ok
+
+
+def _download_model(spec: dict, token: str | None, out: Callable[[str], None]) -> bool:
+    """Download the model described by *spec*, reporting through *out*."""
+    out(f"\n{'='*60}")
+    out(f"  {spec['label']}")
+    out(f"{'='*60}")
 
     if spec.get("gated") and not token:
-        print("  WARNING: This model is gated and requires an HF token.")
-        print("  Pass --token or set HF_TOKEN in .env")
-        print("  Skipping...")
+        out("  WARNING: This model is gated and requires an HF token.")
+        out("  Pass --token or set HF_TOKEN in .env")
+        out("  Skipping...")
         return False
 
     try:
@@ -148,39 +174,48 @@ def download_model(key: str, spec: dict, token: str | None) -> bool:
 
         if model_type == "hf_snapshot":
             path = download_hf_snapshot(spec["repo"], token)
-            print(f"  Cached at: {path}")
+            out(f"  Cached at: {path}")
 
         elif model_type == "hf_snapshot_multi":
             for repo in spec["repos"]:
-                print(f"  Downloading {repo}...")
+                out(f"  Downloading {repo}...")
                 path = download_hf_snapshot(repo, token)
-                print(f"  Cached at: {path}")
+                out(f"  Cached at: {path}")
 
         elif model_type == "hf_files":
             paths = download_hf_files(spec["repo"], spec["files"], token)
             for p in paths:
-                print(f"  Cached at: {p}")
+                out(f"  Cached at: {p}")
 
         elif model_type == "demucs":
-            print(f"  Downloading {spec['model_name']} via torch hub...")
+            out(f"  Downloading {spec['model_name']} via torch hub...")
             download_demucs(spec["model_name"])
-            print("  Cached in torch hub")
+            out("  Cached in torch hub")
 
-        print("  DONE")
+        out("  DONE")
         return True
 
     except Exception as exc:
-        print(f"  FAILED: {exc}")
+        out(f"  FAILED: {exc}")
         return False
 
 
 def get_dir_size(path: Path) -> str:
-    """Get human-readable directory size."""
+    """Get human-readable directory size.
+
+    Symlinks are not followed, so HF cache snapshot links are not counted
+    on top of the blobs they point to.
+    """
     total = 0
     if path.exists():
-        for f in path.rglob("*"):
-            if f.is_file():
-                total += f.stat().st_size
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
     if total < 1024 * 1024:
         return f"{total / 1024:.1f} KB"
     if total < 1024 * 1024 * 1024:
@@ -211,6 +246,12 @@ def main() -> None:
         choices=list(MODELS.keys()),
         help="Download only this model (default: all)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Number of models to download concurrently (default: 4)",
+    )
     args = parser.parse_args()
 
     models_dir = args.models_dir.resolve()
@@ -228,10 +269,13 @@ def main() -> None:
     else:
         targets = MODELS
 
-    # Download
-    results = {}
-    for key, spec in targets.items():
-        results[key] = download_model(key, spec, token)
+    # Download independent models concurrently
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {
+            key: pool.submit(download_model, key, spec, token)
+            for key, spec in targets.items()
+        }
+    results = {key: future.result() for key, future in futures.items()}
 
     # Summary
     print(f"\n{'='*60}")
@@ -0,0 +1,45 @@
+"""Tests for the signal-analysis helpers in ``app.utils.audio_utils``."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.utils import audio_utils
+
+
+def _baseline_rms(audio: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(audio.astype(np.float64) ** 2)))
+
+
+@pytest.mark.parametrize(
+    "audio",
+    [
+        np.array([30000, 30000], dtype=np.int16),
+        np.array([-32768, 32767, 12345, -1], dtype=np.int16),
+        np.full(2_000_000, 0.1, dtype=np.float32)
+        + np.random.default_rng(0).standard_normal(2_000_000).astype(np.float32) * 1e-3,
+    ],
+    ids=["int16-overflow", "int16-extremes", "long-float32"],
+)
+def test_compute_rms_matches_float64_baseline(audio: np.ndarray) -> None:
+    assert audio_utils.compute_rms(audio) == pytest.approx(
+        _baseline_rms(audio), rel=1e-9,
+    )
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_detect_silence_handles_int16_input(
+    monkeypatch: pytest.MonkeyPatch, use_numba: bool,
+) -> None:
+    if use_numba and audio_utils._kernels() is None:
+        pytest.skip("numba not installed")
+    if not use_numba:
+        monkeypatch.setattr(audio_utils, "_kernels", lambda: None)
+    sr = 16000
+    tone = (np.sin(np.arange(sr) * 0.05) * 20000).astype(np.int16)
+    audio = np.concatenate([tone, np.zeros(sr // 2, dtype=np.int16), tone])
+
+    regions = audio_utils.detect_silence(audio, sr, threshold_db=20.0)
+
+    assert regions == [(1.0, 1.5)]